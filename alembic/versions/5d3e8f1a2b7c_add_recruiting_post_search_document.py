@@ -0,0 +1,51 @@
+"""add recruiting post search document
+
+Revision ID: 5d3e8f1a2b7c
+Revises: 913d077c8061
+Create Date: 2026-10-18 04:15:02.118431
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d3e8f1a2b7c"
+down_revision: Union[str, Sequence[str], None] = "913d077c8061"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 한국어는 형태소 분석 없이도 부분 일치가 되도록 trigram(pg_trgm) 사용
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column(
+        "recruiting_posts",
+        sa.Column(
+            "search_document",
+            sa.Text(),
+            sa.Computed("title || ' ' || content", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_recruiting_posts_search_document_trgm",
+        "recruiting_posts",
+        ["search_document"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"search_document": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_recruiting_posts_search_document_trgm", table_name="recruiting_posts"
+    )
+    op.drop_column("recruiting_posts", "search_document")
@@ -0,0 +1,141 @@
+"""add list and filter indexes
+
+Revision ID: a8c41e07d9b2
+Revises: 5d3e8f1a2b7c
+Create Date: 2026-10-18 05:02:47.530912
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8c41e07d9b2"
+down_revision: Union[str, Sequence[str], None] = "5d3e8f1a2b7c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index 이름, 테이블, 컬럼, partial index 조건)
+INDEXES = [
+    # 구인글 목록 SortBy별 keyset 정렬
+    (
+        "ix_recruiting_posts_created_at_id",
+        "recruiting_posts",
+        ["created_at", "id"],
+        None,
+    ),
+    (
+        "ix_recruiting_posts_views_count_created_at_id",
+        "recruiting_posts",
+        ["views_count", "created_at", "id"],
+        None,
+    ),
+    (
+        "ix_recruiting_posts_comments_count_created_at_id",
+        "recruiting_posts",
+        ["comments_count", "created_at", "id"],
+        None,
+    ),
+    (
+        "ix_recruiting_posts_bookmarks_count_created_at_id",
+        "recruiting_posts",
+        ["bookmarks_count", "created_at", "id"],
+        None,
+    ),
+    # author / orientation 필터
+    (
+        "ix_recruiting_posts_user_id_created_at_id",
+        "recruiting_posts",
+        ["user_id", "created_at", "id"],
+        None,
+    ),
+    (
+        "ix_recruiting_posts_orientation_id",
+        "recruiting_posts",
+        ["orientation_id"],
+        None,
+    ),
+    # region/genre/position/experienced_level 필터 (link 테이블 역방향)
+    (
+        "ix_recruiting_post_regions_region_id_post_id",
+        "recruiting_post_regions",
+        ["region_id", "post_id"],
+        None,
+    ),
+    (
+        "ix_recruiting_post_genres_genre_id_post_id",
+        "recruiting_post_genres",
+        ["genre_id", "post_id"],
+        None,
+    ),
+    (
+        "ix_recruiting_post_positions_position_id_post_id",
+        "recruiting_post_positions",
+        ["position_id", "post_id"],
+        None,
+    ),
+    (
+        "ix_recruiting_post_positions_experience_level_id_post_id",
+        "recruiting_post_positions",
+        ["desired_experience_level_id", "post_id"],
+        None,
+    ),
+    # 댓글 목록
+    (
+        "ix_comments_post_id_created_at_id_top_level",
+        "comments",
+        ["post_id", "created_at", "id"],
+        "parent_comment_id IS NULL",
+    ),
+    (
+        "ix_comments_user_id_created_at_id",
+        "comments",
+        ["user_id", "created_at", "id"],
+        None,
+    ),
+    ("ix_comments_parent_comment_id", "comments", ["parent_comment_id"], None),
+    # 북마크 역방향
+    (
+        "ix_post_bookmarks_bookmarked_post_id",
+        "post_bookmarks",
+        ["bookmarked_post_id"],
+        None,
+    ),
+    (
+        "ix_user_bookmarks_bookmarked_user_id",
+        "user_bookmarks",
+        ["bookmarked_user_id"],
+        None,
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서 실행해야 함
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,59 @@
+"""add refresh token purge indexes
+
+Revision ID: b7d3f9a2c6e1
+Revises: f6d2b8e1c5a4
+Create Date: 2026-10-18 09:41:27.503218
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d3f9a2c6e1"
+down_revision: Union[str, Sequence[str], None] = "f6d2b8e1c5a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 만료/폐기된 토큰 batch 정리가 테이블 전체를 읽지 않도록
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_refresh_tokens_expired_at",
+            "refresh_tokens",
+            ["expired_at"],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_refresh_tokens_revoked_id",
+            "refresh_tokens",
+            ["id"],
+            unique=False,
+            if_not_exists=True,
+            postgresql_where=sa.text("is_revoked"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_refresh_tokens_revoked_id",
+            table_name="refresh_tokens",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_refresh_tokens_expired_at",
+            table_name="refresh_tokens",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,56 @@
+"""add comment reply keyset index
+
+Revision ID: c2e6f4a9d1b3
+Revises: a8c41e07d9b2
+Create Date: 2026-10-18 06:14:09.218337
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c2e6f4a9d1b3"
+down_revision: Union[str, Sequence[str], None] = "a8c41e07d9b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 부모별 최신 대댓글 N개를 인덱스만으로 읽도록 (created_at, id)까지 포함
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_comments_parent_comment_id_created_at_id",
+            "comments",
+            ["parent_comment_id", "created_at", "id"],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_comments_parent_comment_id",
+            table_name="comments",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_comments_parent_comment_id",
+            "comments",
+            ["parent_comment_id"],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_comments_parent_comment_id_created_at_id",
+            table_name="comments",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,63 @@
+"""backfill comment path
+
+Revision ID: e4b9a7c3f2d6
+Revises: c2e6f4a9d1b3
+Create Date: 2026-10-18 06:48:31.604125
+
+"""
+
+from typing import Sequence, Union
+
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b9a7c3f2d6"
+down_revision: Union[str, Sequence[str], None] = "c2e6f4a9d1b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # path = 조상부터 자신까지 id(32자리 hex)를 이어 붙인 값
+    # 최상위 댓글부터 한 단계씩 채움 (부모 path가 먼저 채워져 있어야 함)
+    op.execute("""
+        UPDATE comments
+        SET path = replace(id::text, '-', '')
+        WHERE parent_comment_id IS NULL AND path IS NULL
+        """)
+    op.execute("""
+        WITH RECURSIVE tree AS (
+            SELECT id, path
+            FROM comments
+            WHERE parent_comment_id IS NULL
+            UNION ALL
+            SELECT c.id, tree.path || replace(c.id::text, '-', '')
+            FROM comments c
+            JOIN tree ON c.parent_comment_id = tree.id
+        )
+        UPDATE comments
+        SET path = tree.path
+        FROM tree
+        WHERE comments.id = tree.id AND comments.path IS NULL
+        """)
+    # 새 댓글은 INSERT 시점에 path를 채우므로 이후로는 NULL이 없음
+    op.alter_column(
+        "comments",
+        "path",
+        existing_type=sqlmodel.sql.sqltypes.AutoString(length=255),
+        nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "comments",
+        "path",
+        existing_type=sqlmodel.sql.sqltypes.AutoString(length=255),
+        nullable=True,
+    )
+    op.execute("UPDATE comments SET path = NULL")
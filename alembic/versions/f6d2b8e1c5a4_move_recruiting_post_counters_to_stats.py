@@ -0,0 +1,88 @@
+"""move recruiting post counters to stats
+
+Revision ID: f6d2b8e1c5a4
+Revises: e4b9a7c3f2d6
+Create Date: 2026-10-18 07:32:56.117402
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6d2b8e1c5a4"
+down_revision: Union[str, Sequence[str], None] = "e4b9a7c3f2d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTER_COLUMNS = ["views_count", "comments_count", "bookmarks_count"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "recruiting_post_stats",
+        sa.Column("post_id", sa.Uuid(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("views_count", sa.Integer(), nullable=False),
+        sa.Column("comments_count", sa.Integer(), nullable=False),
+        sa.Column("bookmarks_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["post_id"], ["recruiting_posts.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("post_id"),
+    )
+    # 카운터 UPDATE가 같은 페이지 안에서 처리되도록 여유 공간 확보
+    op.execute("ALTER TABLE recruiting_post_stats SET (fillfactor = 70)")
+
+    op.execute("""
+        INSERT INTO recruiting_post_stats
+            (post_id, created_at, views_count, comments_count, bookmarks_count)
+        SELECT id, created_at, views_count, comments_count, bookmarks_count
+        FROM recruiting_posts
+        """)
+
+    for column in COUNTER_COLUMNS:
+        op.create_index(
+            f"ix_recruiting_post_stats_{column}_created_at_post_id",
+            "recruiting_post_stats",
+            [column, "created_at", "post_id"],
+            unique=False,
+        )
+        op.drop_index(
+            f"ix_recruiting_posts_{column}_created_at_id",
+            table_name="recruiting_posts",
+            if_exists=True,
+        )
+        op.drop_column("recruiting_posts", column)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in COUNTER_COLUMNS:
+        op.add_column(
+            "recruiting_posts",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+        op.alter_column("recruiting_posts", column, server_default=None)
+
+    op.execute("""
+        UPDATE recruiting_posts
+        SET views_count = s.views_count,
+            comments_count = s.comments_count,
+            bookmarks_count = s.bookmarks_count
+        FROM recruiting_post_stats s
+        WHERE s.post_id = recruiting_posts.id
+        """)
+
+    for column in COUNTER_COLUMNS:
+        op.create_index(
+            f"ix_recruiting_posts_{column}_created_at_id",
+            "recruiting_posts",
+            [column, "created_at", "id"],
+            unique=False,
+        )
+    op.drop_table("recruiting_post_stats")
@@ -6,19 +6,31 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from app.api.v1.dependencies import get_current_user_or_none, get_current_user_required
+from app.api.v1.dependencies import (
+    get_current_principal_or_none,
+    get_current_user_required,
+)
 from app.core.database import get_async_session
 from app.exceptions.exceptions import (
     CommentNotFound,
+    InvalidCursor,
     NotFirstParentComment,
     PostNotFound,
     UserNotCommentOwner,
     UserNotFound,
 )
-from app.schemas.comment_schema import GetCommentCursorResponse, UpdateCommentRequest
+from app.schemas.comment_schema import (
+    GetChildCommentCursorResponse,
+    GetCommentCursorResponse,
+    GetCommentThreadCursorResponse,
+    UpdateCommentRequest,
+)
+from app.schemas.token import Principal
 from app.services.comment_service import (
     service_delete_comment,
     service_get_comment_list,
+    service_get_comment_thread,
+    service_get_reply_list,
     service_update_comment_content,
 )
 
@@ -45,11 +57,10 @@ logger = logging.getLogger(__name__)
     - HTTP_400_BAD_REQUEST:
         - post_id와 author 쿼리 파라미터가 둘 다 존재하지 않을 때
         - post_id와 author 쿼리 파라미터가 둘 다 존재할 때
-        - post_id 파라미터를 보냈는데
-          cursor 값이 최상위 부모 댓글이 id가 아닐 때
+        - cursor가 위조되었거나, 다른 post_id / author 목록에서 발급된 cursor일 때
     
     - HTTP_404_NOT_FOUND:
-        - 조회할 구인글 / 사용자 / cursor의 comment가 존재하지 않을 때
+        - 조회할 구인글 / 사용자가 존재하지 않을 때
       
     - HTTP_422_UNPROCESSABLE_ENTITY(FastAPI server에서 자동 응답): 
         - json type이 잘못되었을 때
@@ -64,9 +75,9 @@ async def api_get_comment_list(
     post_id: Optional[uuid.UUID] = Query(default=None),
     author: Optional[uuid.UUID] = Query(default=None),
     limit: int = Query(default=20, le=20),
-    cursor: Optional[uuid.UUID] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
     db: AsyncSession = Depends(get_async_session),
-    current_user: str = Depends(get_current_user_or_none),
+    current_user: Optional[Principal] = Depends(get_current_principal_or_none),
 ) -> GetCommentCursorResponse:
 
     if post_id is None and author is None:
@@ -93,9 +104,9 @@ async def api_get_comment_list(
             limit=limit,
             cursor=cursor,
         )
-    except (PostNotFound, UserNotFound, CommentNotFound) as e:
+    except (PostNotFound, UserNotFound) as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except NotFirstParentComment as e:
+    except InvalidCursor as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         logger.error(
@@ -109,6 +120,135 @@ async def api_get_comment_list(
     return get_comment_cursor_response
 
 
+# 대댓글 목록 조회
+@comment_router.get(
+    "/{comment_id}/replies",
+    summary="대댓글 목록 조회",
+    description="""
+    Responses
+    
+    성공
+    - HTTP_200_OK: 처리 성공
+        - 댓글 목록의 children_next_cursor를 cursor로 보내면 미리보기 이후부터 조회
+    
+    실패
+    - HTTP_401_UNAUTHORIZED: 
+        - 토큰이 만료되었거나
+        - 유효하지 않은 토큰 (형식)일 경우
+        
+    - HTTP_400_BAD_REQUEST:
+        - comment_id가 최상위 부모 댓글이 아닐 때
+        - cursor가 위조되었을 때
+    
+    - HTTP_404_NOT_FOUND:
+        - 부모 댓글이 존재하지 않을 때
+      
+    - HTTP_422_UNPROCESSABLE_ENTITY(FastAPI server에서 자동 응답): 
+        - 쿼리 파라미터의 지정 데이터타입이 아니거나, 지정된 제약조건에 벗어났을 때
+    
+    - HTTP_500_INTERNAL_SERVER_ERROR: 
+        - 예상치 못한 서버 오류(DB 연결 오류, 타입 에러 등 버그)
+    """,
+    status_code=status.HTTP_200_OK,
+)
+async def api_get_reply_list(
+    comment_id: uuid.UUID,
+    limit: int = Query(default=20, le=20),
+    cursor: Optional[str] = Query(default=None),
+    db: AsyncSession = Depends(get_async_session),
+    current_user: Optional[Principal] = Depends(get_current_principal_or_none),
+) -> GetChildCommentCursorResponse:
+
+    current_user_id = None  # 기본적으로 로그인 하지 않은 사용자도 사용 가능
+    if current_user:  # Bearer 있으면,
+        current_user_id = current_user.id
+
+    try:
+        get_child_comment_cursor_response = await service_get_reply_list(
+            db=db,
+            parent_comment_id=comment_id,
+            current_user_id=current_user_id,
+            limit=limit,
+            cursor=cursor,
+        )
+    except CommentNotFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except (NotFirstParentComment, InvalidCursor) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Unexpected error in api_get_reply_list: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버에 예상치 못한 오류가 발생했습니다.",
+        )
+
+    return get_child_comment_cursor_response
+
+
+# 댓글 스레드 조회
+@comment_router.get(
+    "/{comment_id}/thread",
+    summary="댓글 스레드 조회",
+    description="""
+    Responses
+    
+    성공
+    - HTTP_200_OK: 처리 성공
+        - comment_id 댓글과 모든 하위 댓글을 스레드 순서(부모 다음에 자식)로 반환
+    
+    실패
+    - HTTP_401_UNAUTHORIZED: 
+        - 토큰이 만료되었거나
+        - 유효하지 않은 토큰 (형식)일 경우
+        
+    - HTTP_400_BAD_REQUEST:
+        - cursor가 위조되었거나, 다른 스레드에서 발급된 cursor일 때
+    
+    - HTTP_404_NOT_FOUND:
+        - 댓글이 존재하지 않을 때
+      
+    - HTTP_422_UNPROCESSABLE_ENTITY(FastAPI server에서 자동 응답): 
+        - 쿼리 파라미터의 지정 데이터타입이 아니거나, 지정된 제약조건에 벗어났을 때
+    
+    - HTTP_500_INTERNAL_SERVER_ERROR: 
+        - 예상치 못한 서버 오류(DB 연결 오류, 타입 에러 등 버그)
+    """,
+    status_code=status.HTTP_200_OK,
+)
+async def api_get_comment_thread(
+    comment_id: uuid.UUID,
+    limit: int = Query(default=50, le=100),
+    cursor: Optional[str] = Query(default=None),
+    db: AsyncSession = Depends(get_async_session),
+    current_user: Optional[Principal] = Depends(get_current_principal_or_none),
+) -> GetCommentThreadCursorResponse:
+
+    current_user_id = None  # 기본적으로 로그인 하지 않은 사용자도 사용 가능
+    if current_user:  # Bearer 있으면,
+        current_user_id = current_user.id
+
+    try:
+        get_comment_thread_cursor_response = await service_get_comment_thread(
+            db=db,
+            comment_id=comment_id,
+            current_user_id=current_user_id,
+            limit=limit,
+            cursor=cursor,
+        )
+    except CommentNotFound as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"Unexpected error in api_get_comment_thread: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버에 예상치 못한 오류가 발생했습니다.",
+        )
+
+    return get_comment_thread_cursor_response
+
+
 # FR-020: 댓글 수정
 @comment_router.patch(
     "/{comment_id}",
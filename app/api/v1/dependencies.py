@@ -1,41 +1,62 @@
 # app/api/v1/dependencies.py
+import uuid
+from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 from pydantic import ValidationError
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from app.core.config import settings
-from app.core.database import get_async_session
+from app.core.database import AsyncSessionLocal
+from app.core.principal_cache import principal_cache
 from app.models.user_model import Profile, ProfilePositionLink, User
-from app.schemas.token import TokenPayload
+from app.schemas.token import Principal, TokenPayload
 
 # /api/v1/auth/token 경로에서 토큰을 가져오도록 설정
 reusable_oauth2 = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
 
-async def get_current_user(
-    db: AsyncSession = Depends(get_async_session), token: str = Depends(reusable_oauth2)
-) -> User:
+def decode_access_token(token: str) -> Principal:
     """
-    JWT 토큰을 검증 및 현재 로그인된 사용자 객체를 반환
+    JWT 토큰을 검증하고 claim(sub, exp)으로 Principal을 만듦
     """
     try:
         payload = jwt.decode(
             token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
         )
         token_data = TokenPayload(**payload)
-    except (jwt.JWTError, ValidationError):
+        return Principal(
+            id=uuid.UUID(token_data.sub),
+            expires_at=datetime.fromtimestamp(payload["exp"], tz=timezone.utc),
+        )
+    except (jwt.JWTError, ValidationError, KeyError, TypeError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+
+def get_token_user_id(token: str) -> uuid.UUID:
+    """
+    JWT 토큰을 검증하고 sub(user_id)를 반환
+    """
+    return decode_access_token(token).id
+
+
+async def get_principal(user_id: uuid.UUID) -> User | None:
+    """
+    현재 사용자 객체를 principal 캐시에서 조회하고, 없으면 DB에서 로드해서 캐시
+    요청 세션과 분리된 세션으로 로드해서 캐시된 객체가 특정 요청 세션에 묶이지 않도록 함
+    """
+    user = principal_cache.get(user_id)
+    if user is not None:
+        return user
+
     # User를 조회할 때, profile 관계를 즉시 로딩(eager load)하도록 옵션을 추가
     statement = (
         select(User)
@@ -51,10 +72,23 @@ async def get_current_user(
             selectinload(User.profile).selectinload(Profile.genres),
             selectinload(User.profile).selectinload(Profile.positions),
         )
-        .where(User.id == token_data.sub)
+        .where(User.id == user_id)
     )
-    result = await db.execute(statement)
-    user = result.scalar_one_or_none()
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(statement)
+        user = result.scalar_one_or_none()
+
+    if user is not None:
+        principal_cache.set(user_id, user)
+    return user
+
+
+async def get_current_user(token: str = Depends(reusable_oauth2)) -> User:
+    """
+    JWT 토큰을 검증 및 현재 로그인된 사용자 객체를 반환
+    (세션에서 분리된 캐시 객체: 수정할 때는 요청 세션에서 다시 로드해서 사용)
+    """
+    user = await get_principal(get_token_user_id(token))
 
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
@@ -67,50 +101,34 @@ optional_oauth2 = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
 
 
 async def get_current_user_or_none(
-    db: AsyncSession = Depends(get_async_session),
     token: Optional[str] = Depends(optional_oauth2),
 ) -> Optional[User]:
 
     if not token:
         return None
 
-    try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
-    except (jwt.JWTError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    statement = select(User).where(User.id == token_data.sub)
-    result = await db.execute(statement)
-    return result.scalar_one_or_none()
+    return await get_principal(get_token_user_id(token))
 
 
 async def get_current_user_required(
-    db: AsyncSession = Depends(get_async_session),
     token: str = Depends(reusable_oauth2),
 ) -> User:
-    try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
-    except (jwt.JWTError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    statement = select(User).where(User.id == token_data.sub)
-    result = await db.execute(statement)
-    user = result.scalar_one_or_none()
+    user = await get_principal(get_token_user_id(token))
 
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return user
+
+
+async def get_current_principal_or_none(
+    token: Optional[str] = Depends(optional_oauth2),
+) -> Optional[Principal]:
+    """
+    토큰의 claim만으로 현재 사용자(id)를 반환 (DB 조회 없음)
+    is_owner / is_bookmarked 계산처럼 id만 필요한 조회 API용,
+    User 객체가 필요하면 get_current_user_or_none 사용
+    """
+    if not token:
+        return None
+
+    return decode_access_token(token)
@@ -33,7 +33,7 @@ async def login_for_access_token(
             detail="이메일이 존재하지 않습니다.",
         )
 
-    if not verify_password(form_data.password, user.password_hash):
+    if not await verify_password(form_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="비밀번호를 확인해주세요.",
@@ -73,15 +73,13 @@ async def refresh_access_token(
             detail="Refresh token not found in cookies",
         )
 
-    user = await auth_service.get_user_from_refresh_token(db, token=refresh_token)
-    if not user:
+    # 기존 토큰 폐기 + 새 토큰 생성 및 DB 저장
+    tokens = await auth_service.rotate_tokens(db, token=refresh_token)
+    if not tokens:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
         )
 
-    # 새 토큰 생성 및 DB 저장
-    tokens = await auth_service.create_tokens_and_save_refresh_token(db=db, user=user)
-
     # 쿠키 갱신
     response.set_cookie(
         key="refresh_token",
@@ -6,16 +6,16 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.api.v1.dependencies import get_current_user_or_none
+from app.api.v1.dependencies import get_current_principal_or_none
 from app.core.database import get_async_session
 from app.models.bookmark_model import UserBookmark
-from app.models.user_model import User
 from app.schemas.profile import (
     PositionWithExperienceRead,
     ProfileDetailRead,
     ProfileListRead,
     ProfileListResponse,
 )
+from app.schemas.token import Principal
 from app.services.profile_service import profile_service
 
 router = APIRouter()
@@ -24,7 +24,7 @@ router = APIRouter()
 @router.get("", response_model=ProfileListResponse)
 async def get_profiles(
     db: AsyncSession = Depends(get_async_session),
-    current_user: Optional[User] = Depends(get_current_user_or_none),
+    current_user: Optional[Principal] = Depends(get_current_principal_or_none),
     limit: int = Query(20, gt=0, le=100),
     cursor: Optional[str] = Query(None),
     nickname: Optional[str] = Query(None),
@@ -114,7 +114,7 @@ async def get_profiles(
 async def get_profile(
     user_id: uuid.UUID,
     db: AsyncSession = Depends(get_async_session),
-    current_user: Optional[User] = Depends(get_current_user_or_none),
+    current_user: Optional[Principal] = Depends(get_current_principal_or_none),
 ):
     """타 사용자 프로필 상세 정보를 조회"""
     current_user_id = current_user.id if current_user else None
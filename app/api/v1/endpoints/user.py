@@ -118,7 +118,7 @@ async def delete_user_me(
             detail="소셜 로그인 사용자는 비밀번호로 계정을 삭제할 수 없습니다.",
         )
 
-    if not verify_password(user_delete.password, current_user.password_hash):
+    if not await verify_password(user_delete.password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="잘못된 비밀번호입니다.",
@@ -1,13 +1,29 @@
 # app/api/v1/image_upload_router.py
 import logging
 
-from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from starlette import status
 
-from app.schemas.image_upload_schema import ImageUploadResponse
-from app.services.image_upload_service import service_upload_image
+from app.api.v1.dependencies import get_current_user_required
+from app.exceptions.exceptions import (
+    ImageNotUploaded,
+    InvalidImageUpload,
+    PresignedUploadNotSupported,
+)
+from app.schemas.image_upload_schema import (
+    ImageConfirmRequest,
+    ImagePresignRequest,
+    ImagePresignResponse,
+    ImageUploadResponse,
+)
+from app.services.image_upload_service import (
+    service_confirm_image_upload,
+    service_create_presigned_image_upload,
+    service_upload_image,
+)
 
-image_upload_router = APIRouter()
+# 업로드/presigned 발급/confirm 모두 로그인 사용자만
+image_upload_router = APIRouter(dependencies=[Depends(get_current_user_required)])
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +34,61 @@ logger = logging.getLogger(__name__)
 async def api_upload_image(file: UploadFile = File(...)) -> ImageUploadResponse:
     try:
         image_url = await service_upload_image(file)
+    except InvalidImageUpload as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버에 예상치 못한 오류가 발생했습니다.",
+        )
+
+    return ImageUploadResponse(image_url=image_url)
+
+
+@image_upload_router.post(
+    "/presigned",
+    response_model=ImagePresignResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def api_create_presigned_image_upload(
+    request: ImagePresignRequest,
+) -> ImagePresignResponse:
+    """
+    S3로 직접 업로드하기 위한 presigned POST 발급
+    응답의 url로 fields + file(마지막)을 multipart/form-data로 POST한 뒤 /confirm 호출
+    """
+    try:
+        return await service_create_presigned_image_upload(
+            request.filename, request.content_type
+        )
+    except InvalidImageUpload as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PresignedUploadNotSupported as e:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(e))
+    except Exception as e:
+        logger.error(e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="서버에 예상치 못한 오류가 발생했습니다.",
+        )
+
+
+@image_upload_router.post("/confirm", response_model=ImageUploadResponse)
+async def api_confirm_image_upload(
+    request: ImageConfirmRequest,
+) -> ImageUploadResponse:
+    """presigned POST로 올린 이미지가 저장되었는지 확인하고 URL 반환"""
+    try:
+        image_url = await service_confirm_image_upload(request.key)
+    except InvalidImageUpload as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ImageNotUploaded as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(e, exc_info=True)
         raise HTTPException(
@@ -3,12 +3,13 @@
 # 에러 체크용 import
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_async_session  # 비동기 세션 의존성
-from app.schemas.master_data_schema import MasterDataResponse, OptionOut
-from app.services.master_data_service import get_all_master_data
+from app.schemas.master_data_schema import MasterDataResponse
+from app.services.master_data_service import accepts_gzip, get_master_data_payload
 
 # 에러 체크용 logger
 logger = logging.getLogger(__name__)
@@ -17,21 +18,36 @@ master_data_router = APIRouter()
 
 @master_data_router.get("", response_model=MasterDataResponse)
 async def read_master_data(
+    request: Request,
     db: AsyncSession = Depends(get_async_session),
 ):  # 비동기 방식
+    """
+    미리 직렬화해 둔 JSON 바이트를 그대로 응답
+    If-None-Match가 ETag와 같으면 본문 없이 304
+    """
     try:
-        data = await get_all_master_data(db)  # 반드시 await
-
-        # 데이터가 정상적으로 반환되지 않으면 예외를 발생시킬 수 있음
-        if not data:
-            raise HTTPException(
-                status_code=500, detail="Master data is empty or invalid"
-            )
-        return {
-            key: [OptionOut(id=item.id, name=item.name) for item in value]
-            for key, value in data.items()
-        }
-
+        payload = await get_master_data_payload(db)  # 반드시 await
     except Exception as e:
         logger.error(f"Error in read_master_data: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal Server Error: {str(e)}")
+
+    use_gzip = accepts_gzip(request.headers.get("accept-encoding"))
+    headers = {
+        "ETag": payload.gzip_etag if use_gzip else payload.etag,
+        "Cache-Control": (
+            f"public, max-age={settings.MASTER_DATA_CACHE_MAX_AGE_SECONDS}"
+        ),
+        "Vary": "Accept-Encoding",
+    }
+
+    if payload.is_not_modified(request.headers.get("if-none-match")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(
+            content=payload.gzip_body, media_type="application/json", headers=headers
+        )
+    return Response(
+        content=payload.body, media_type="application/json", headers=headers
+    )
@@ -2,17 +2,18 @@ import logging
 import uuid
 from typing import Callable, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from app.api.v1.dependencies import (
-    get_current_user_or_none,
+    get_current_principal_or_none,
     get_current_user_required,
 )
 from app.core.database import get_async_session
 from app.exceptions.exceptions import (
     CommentNotFound,
+    InvalidCursor,
     NotFirstParentComment,
     PostAlreadyBookmarked,
     PostBookmarkNotFound,
@@ -29,6 +30,7 @@ from app.schemas.recruiting_schema import (
     GetRecruitingDetailResponse,
     RecruitingDetailRequest,
 )
+from app.schemas.token import Principal
 from app.services.bookmark_service import BookmarkService, get_bookmark_service
 from app.services.recruiting_service import (
     service_create_comment,
@@ -80,9 +82,11 @@ def make_uuid_list_parser(param_name: str) -> Callable:
         - bookmarks=me 라고 보냈을 때
           Bearer token이 없는 경우(로그인 안되어 있는 경우)
           
+    - HTTP_400_BAD_REQUEST:
+        - cursor가 위조되었거나, 다른 sort_by로 발급된 cursor일 때
+
     - HTTP_404_NOT_FOUND:
 		- author로 보낸 작성자가 없을 때
-		- cursor로 보낸 구인글이 없을 때
       
     - HTTP_422_UNPROCESSABLE_ENTITY(FastAPI server에서 자동 응답): 
         - json type이 잘못되었을 때
@@ -96,7 +100,7 @@ def make_uuid_list_parser(param_name: str) -> Callable:
 )
 async def api_get_recruiting(
     limit: Optional[int] = Query(20, le=20),
-    cursor: Optional[uuid.UUID] = Query(None),
+    cursor: Optional[str] = Query(None),
     author: Optional[uuid.UUID] = Query(None),
     bookmarks: Optional[IsBookmarked] = Query(None),
     search_query: Optional[str] = Query(None),
@@ -113,8 +117,8 @@ async def api_get_recruiting(
     genre_ids: Optional[List[uuid.UUID]] = Depends(make_uuid_list_parser("genre_ids")),
     sort_by: SortBy = Query(SortBy.LATEST),
     db: AsyncSession = Depends(get_async_session),
-    current_user: str = Depends(get_current_user_or_none),
-) -> GetRecruitingCursorResponse:
+    current_user: Optional[Principal] = Depends(get_current_principal_or_none),
+) -> Response:
 
     current_user_id = None  # 기본적으로 로그인 하지 않은 사용자도 사용 가능
     if current_user:  # Bearer 있으면,
@@ -126,7 +130,7 @@ async def api_get_recruiting(
         )
 
     try:
-        get_recruiting_cursor_response = await service_get_recruiting_list(
+        get_recruiting_cursor_body = await service_get_recruiting_list(
             db=db,
             current_user_id=current_user_id,
             limit=limit,
@@ -141,7 +145,9 @@ async def api_get_recruiting(
             genre_ids=genre_ids,
             sort_by=sort_by,
         )
-    except (UserNotFound, PostNotFound) as e:
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except UserNotFound as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
         logger.error(
@@ -152,7 +158,8 @@ async def api_get_recruiting(
             detail="서버에 예상치 못한 오류가 발생했습니다.",
         )
 
-    return get_recruiting_cursor_response
+    # 이미 직렬화된 응답(캐시)을 그대로 반환
+    return Response(content=get_recruiting_cursor_body, media_type="application/json")
 
 
 # FR-014: 구인글 작성
@@ -240,7 +247,7 @@ async def api_create_recruiting(
 async def api_get_recruiting_detail(
     post_id: uuid.UUID,
     db: AsyncSession = Depends(get_async_session),
-    current_user: str = Depends(get_current_user_or_none),
+    current_user: Optional[Principal] = Depends(get_current_principal_or_none),
 ) -> GetRecruitingDetailResponse:
 
     current_user_id = None  # 기본적으로 로그인 하지 않은 사용자도 사용 가능
@@ -0,0 +1,47 @@
+# app/commands/generate_image_variants.py
+"""
+variant 생성 기능 이전에 올라온 이미지(uploads/)의 썸네일/WebP variant 생성
+variant가 하나라도 없는 원본만 처리
+
+    python -m app.commands.generate_image_variants
+"""
+
+import asyncio
+import logging
+
+from app.core.image_variants import (
+    IMAGE_KEY_PATTERN,
+    IMAGE_VARIANTS,
+    build_variant_key,
+)
+from app.core.storage import storage
+from app.services.image_upload_service import image_variant_pipeline
+
+logger = logging.getLogger(__name__)
+
+
+async def generate_image_variants() -> int:
+    keys = set(await storage.list_keys("uploads/"))
+    missing_keys = sorted(
+        key
+        for key in keys
+        if IMAGE_KEY_PATTERN.fullmatch(key)
+        and any(
+            build_variant_key(key, name) not in keys for name, _, _ in IMAGE_VARIANTS
+        )
+    )
+
+    image_variant_pipeline.start()
+    try:
+        for key in missing_keys:
+            await image_variant_pipeline.enqueue_wait(key)
+        await image_variant_pipeline.join()
+    finally:
+        await image_variant_pipeline.stop()
+        storage.shutdown()
+    return len(missing_keys)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    logger.info("%d images processed", asyncio.run(generate_image_variants()))
@@ -0,0 +1,27 @@
+# app/commands/reconcile_counters.py
+"""
+집계 컬럼(comments_count, bookmarks_count, bookmark_count) 재계산
+
+    python -m app.commands.reconcile_counters
+"""
+
+import asyncio
+import logging
+
+from app.core.database import AsyncSessionLocal
+from app.crud.counter_crud import reconcile_all_counters
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_counters() -> dict[str, int]:
+    async with AsyncSessionLocal() as db:
+        reconciled = await reconcile_all_counters(db)
+        await db.commit()
+    return reconciled
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    for counter, row_count in asyncio.run(reconcile_counters()).items():
+        logger.info("%s: %d rows reconciled", counter, row_count)
@@ -1,3 +1,6 @@
+from typing import Literal, Optional, Union
+
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # from dotenv import load_dotenv
@@ -19,15 +22,96 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     REFRESH_TOKEN_EXPIRE_DAYS: int
 
-    # 이미지 업로드 관련 환경 변수
+    # DB 엔진 / 커넥션 풀 (worker 프로세스당)
+    # 전체 최대 연결 수 = worker 수 * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    DB_ECHO: Union[bool, Literal["debug"]] = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # SQLAlchemy 컴파일된 SQL 캐시 크기
+    DB_QUERY_CACHE_SIZE: int = 500
+    # 같은 쿼리를 N번 실행하면 서버 측 prepared statement로 전환 (None이면 사용 안 함)
+    DB_PREPARE_THRESHOLD: Optional[int] = 5
+    # 연결마다 보관할 prepared statement 최대 개수
+    DB_PREPARED_MAX: int = 100
+    # PgBouncer(transaction pooling) 뒤에서 실행할 때 prepared statement 비활성화
+    DB_PGBOUNCER_MODE: bool = False
+
+    # 이미지 저장소: s3 또는 local (로컬 디스크에 저장하고 nginx가 서빙)
+    STORAGE_BACKEND: Literal["s3", "local"] = "s3"
+
+    # 이미지 업로드 관련 환경 변수 (STORAGE_BACKEND=local)
     IMAGE_UPLOAD_DIR: str = "~/uploads/images"  # ~/uploads/images
     IMAGE_BASE_URL: str = "http://localhost:8000/static/images"  # 상황에 맞게 수정
+    # nginx 없이 실행하는 개발 환경에서는 app이 IMAGE_BASE_URL 경로를 직접 서빙
+    IMAGE_SERVE_FROM_APP: bool = False
+
+    # S3 (STORAGE_BACKEND=s3)
+    AWS_ACCESS_KEY_ID: Optional[str] = None
+    AWS_SECRET_ACCESS_KEY: Optional[str] = None
+    AWS_REGION: Optional[str] = None
+    AWS_S3_BUCKET: Optional[str] = None
+
+    # 동시에 진행하는 업로드 수 (worker 프로세스당)
+    STORAGE_UPLOAD_CONCURRENCY: int = 4
+    # 업로드 파일을 읽어서 보내는 단위 (S3는 multipart part 크기, 최소 5MB)
+    STORAGE_UPLOAD_CHUNK_SIZE: int = 8 * 1024 * 1024
+    # 브라우저가 S3로 직접 올리는 presigned POST 유효 시간(초)과 최대 크기
+    S3_PRESIGNED_POST_EXPIRE_SECONDS: int = 300
+    IMAGE_UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024
+    # 썸네일/WebP variant 생성 대기열 크기, 동시 처리 수, 리사이즈 프로세스 수
+    IMAGE_VARIANT_QUEUE_SIZE: int = 1000
+    IMAGE_VARIANT_CONCURRENCY: int = 2
+    IMAGE_VARIANT_PROCESS_WORKERS: int = 2
+
+    # 마스터 데이터 캐시 변경 확인 주기(초)
+    MASTER_DATA_REFRESH_SECONDS: int = 60
+    # 마스터 데이터 응답의 브라우저/프록시 캐시 시간(초), 이후에는 ETag로 재검증
+    MASTER_DATA_CACHE_MAX_AGE_SECONDS: int = 300
+
+    # 구인글 조회수를 DB에 모아서 반영하는 주기(초)
+    VIEW_COUNT_FLUSH_SECONDS: int = 10
+
+    # 구인글 목록 응답 캐시
+    RECRUITING_LIST_CACHE_TTL_SECONDS: int = 30
+    RECRUITING_LIST_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    # bcrypt 해싱/검증 스레드 수 (worker 프로세스당)
+    PASSWORD_HASH_WORKERS: int = 4
+
+    # 인증 사용자(principal) 캐시
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+
+    # 만료/폐기된 refresh token 정리 주기(초)와 한 번에 삭제할 행 수
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: int = 3600
+    REFRESH_TOKEN_PURGE_BATCH_SIZE: int = 1000
+
+    # 폐기된 refresh token jti 메모리 인덱스 최대 크기 (worker 프로세스당)
+    REVOKED_TOKEN_INDEX_MAX_ENTRIES: int = 100000
+
+    # 댓글 목록에서 부모 댓글마다 함께 내려주는 최신 대댓글 수
+    COMMENT_REPLY_PREVIEW_SIZE: int = 3
 
-    # S3
-    AWS_ACCESS_KEY_ID: str
-    AWS_SECRET_ACCESS_KEY: str
-    AWS_REGION: str
-    AWS_S3_BUCKET: str
+    @model_validator(mode="after")
+    def check_storage_settings(self) -> "Settings":
+        # S3 설정이 빠지면 https://None.s3.None... 같은 URL이 만들어지므로 시작 시 실패
+        if self.STORAGE_BACKEND == "s3":
+            missing = [
+                name
+                for name in (
+                    "AWS_ACCESS_KEY_ID",
+                    "AWS_SECRET_ACCESS_KEY",
+                    "AWS_REGION",
+                    "AWS_S3_BUCKET",
+                )
+                if not getattr(self, name)
+            ]
+            if missing:
+                raise ValueError(f"STORAGE_BACKEND=s3 requires {', '.join(missing)}")
+        return self
 
 
 # 설정 객체 생성
@@ -0,0 +1,58 @@
+# app/core/cursor.py
+import base64
+import hashlib
+import hmac
+import json
+
+from app.core.config import settings
+from app.exceptions.exceptions import InvalidCursor
+
+# 서명 길이(bytes): 위조 방지에는 충분하고 URL은 짧게 유지
+SIGNATURE_SIZE = 16
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(body: bytes) -> bytes:
+    return hmac.new(
+        settings.JWT_SECRET_KEY.encode("utf-8"), body, hashlib.sha256
+    ).digest()[:SIGNATURE_SIZE]
+
+
+def encode_cursor(payload: dict) -> str:
+    """
+    커서에 필요한 값(정렬 키, created_at, id 등)을 서명된 불투명 문자열로 변환
+    """
+    body = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
+    return f"{_b64encode(body)}.{_b64encode(_sign(body))}"
+
+
+def decode_cursor(cursor: str) -> dict:
+    """
+    encode_cursor로 만든 문자열을 검증하고 원래의 dict로 복원
+    형식이 잘못되었거나 서명이 맞지 않으면 InvalidCursor
+    """
+    try:
+        body_part, signature_part = cursor.split(".")
+        body = _b64decode(body_part)
+        signature = _b64decode(signature_part)
+    except ValueError:
+        raise InvalidCursor()
+
+    if not hmac.compare_digest(signature, _sign(body)):
+        raise InvalidCursor()
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise InvalidCursor()
+
+    if not isinstance(payload, dict):
+        raise InvalidCursor()
+    return payload
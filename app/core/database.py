@@ -1,13 +1,53 @@
 # app/core/database.py
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
+
+def get_connect_args() -> dict:
+    """psycopg 연결 옵션"""
+    if settings.DB_PGBOUNCER_MODE:
+        # PgBouncer transaction pooling: 서버 측 prepared statement 사용 안 함
+        return {"prepare_threshold": None}
+    return {"prepare_threshold": settings.DB_PREPARE_THRESHOLD}
+
+
 # 비동기 엔진 생성
-async_engine = create_async_engine(settings.DATABASE_URL, echo=True)
+async_engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DB_ECHO,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    connect_args=get_connect_args(),
+)
+
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def set_prepared_statement_cache_size(dbapi_connection, connection_record):
+    # 연결마다 보관할 prepared statement 최대 개수
+    if not settings.DB_PGBOUNCER_MODE:
+        dbapi_connection.driver_connection.prepared_max = settings.DB_PREPARED_MAX
+
+
+def get_pool_stats() -> dict[str, int]:
+    """커넥션 풀 상태 (worker 프로세스 기준)"""
+    pool = async_engine.pool
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
 
 # 비동기 세션 생성
 AsyncSessionLocal = sessionmaker(
@@ -0,0 +1,166 @@
+# app/core/image_variants.py
+import asyncio
+import io
+import logging
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from app.core.storage import StorageBackend, storage
+
+logger = logging.getLogger(__name__)
+
+# (이름, 크기, 정사각형 crop 여부): 원본 옆에 {uuid}_{이름}.webp로 저장
+IMAGE_VARIANTS = (
+    ("thumb", 160, True),  # 목록/댓글의 작성자 아바타
+    ("medium", 640, False),  # 구인글 상세 이미지
+)
+IMAGE_VARIANT_CONTENT_TYPE = "image/webp"
+
+# 업로드 key 형식: uploads/{uuid4}.{ext}
+IMAGE_KEY_PATTERN = re.compile(
+    r"uploads/(?P<stem>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})"
+    r"\.[A-Za-z0-9]{1,10}"
+)
+
+
+def build_variant_key(key: str, variant: str) -> str:
+    match = IMAGE_KEY_PATTERN.fullmatch(key)
+    return f"uploads/{match['stem']}_{variant}.webp"
+
+
+def get_image_variant_url(image_url: str | None, variant: str) -> str | None:
+    """
+    업로드한 이미지 URL이면 variant URL, 아니면(소셜 프로필 이미지 등) None
+    variant는 업로드 직후 몇 초 동안 아직 없을 수 있으므로 클라이언트는 원본으로 fallback
+    """
+    if not image_url or not image_url.startswith(storage.base_url):
+        return None
+
+    key = image_url.removeprefix(storage.base_url)
+    if not IMAGE_KEY_PATTERN.fullmatch(key):
+        return None
+    return storage.get_url(build_variant_key(key, variant))
+
+
+def render_image_variants(data: bytes) -> dict[str, bytes]:
+    """원본 이미지로 variant(WebP)들을 생성 (프로세스 풀에서 실행)"""
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original)
+        if "transparency" in image.info and image.mode != "RGBA":
+            # 팔레트(P) 등의 투명색은 info["transparency"]에만 있으므로 RGBA로 변환
+            image = image.convert("RGBA")
+        elif image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        variants = {}
+        for name, size, crop in IMAGE_VARIANTS:
+            if crop:
+                resized = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+            else:
+                resized = image.copy()
+                resized.thumbnail((size, size), Image.Resampling.LANCZOS)
+
+            buffer = io.BytesIO()
+            resized.save(buffer, format="WEBP", quality=80, method=4)
+            variants[name] = buffer.getvalue()
+        return variants
+
+
+class ImageVariantPipeline:
+    """
+    업로드된 이미지 key를 queue에 넣으면 background task가
+    원본 다운로드 -> 프로세스 풀에서 variant 생성 -> 원본 옆에 저장
+    queue가 가득 차면 버림 (variant가 없으면 원본 URL로 fallback)
+    """
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        queue_size: int,
+        concurrency: int,
+        process_workers: int,
+    ):
+        self.storage = storage
+        self.concurrency = concurrency
+        self.process_workers = process_workers
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self._executor: ProcessPoolExecutor | None = None
+        self._worker_tasks: list[asyncio.Task] = []
+        # queue에 있거나 처리 중인 key (같은 key를 중복으로 넣지 않음)
+        self._queued_keys: set[str] = set()
+
+    def enqueue(self, key: str) -> bool:
+        if not IMAGE_KEY_PATTERN.fullmatch(key) or key in self._queued_keys:
+            return False
+
+        try:
+            self._queue.put_nowait(key)
+        except asyncio.QueueFull:
+            logger.warning("image variant queue is full, skipped: %s", key)
+            return False
+        self._queued_keys.add(key)
+        return True
+
+    async def enqueue_wait(self, key: str) -> None:
+        """queue에 자리가 날 때까지 기다렸다가 넣음 (기존 이미지 일괄 처리용)"""
+        if key in self._queued_keys:
+            return
+        self._queued_keys.add(key)
+        await self._queue.put(key)
+
+    async def join(self) -> None:
+        """queue에 넣은 작업이 모두 끝날 때까지 대기"""
+        await self._queue.join()
+
+    async def _process(self, key: str) -> None:
+        data = await self.storage.download(key)
+        variants = await asyncio.get_running_loop().run_in_executor(
+            self._executor, render_image_variants, data
+        )
+        for name, body in variants.items():
+            await self.storage.put(
+                build_variant_key(key, name),
+                body,
+                IMAGE_VARIANT_CONTENT_TYPE,
+            )
+
+    async def _run_worker(self) -> None:
+        while True:
+            key = await self._queue.get()
+            try:
+                await self._process(key)
+            except Exception as e:
+                logger.error(
+                    f"Failed to create image variants for {key}: {e}", exc_info=True
+                )
+            finally:
+                self._queued_keys.discard(key)
+                self._queue.task_done()
+
+    def start(self) -> None:
+        if self._worker_tasks:
+            return
+
+        # 이벤트 루프 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.process_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._worker_tasks = [
+            asyncio.create_task(self._run_worker()) for _ in range(self.concurrency)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+        if not self._queue.empty():
+            logger.warning("dropped %d pending image variant jobs", self._queue.qsize())
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,132 @@
+# app/core/master_data.py
+import asyncio
+import logging
+import time
+import uuid
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.common_model import (
+    ExperienceLevel,
+    Genre,
+    Orientation,
+    Position,
+    RecruitmentType,
+    Region,
+)
+
+logger = logging.getLogger(__name__)
+
+MASTER_DATA_MODELS = (
+    Region,
+    Position,
+    Genre,
+    ExperienceLevel,
+    Orientation,
+    RecruitmentType,
+)
+
+
+class MasterDataRegistry:
+    """
+    마스터 데이터(지역, 포지션, 장르, 경력, 성향, 모집 유형)를 메모리에 올려두고
+    id -> name 조회를 DB 왕복 없이 처리
+    """
+
+    def __init__(self, refresh_interval_seconds: float):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._names: dict[type, dict[uuid.UUID, str]] = {
+            model: {} for model in MASTER_DATA_MODELS
+        }
+        self._fingerprint: tuple | None = None
+        self._checked_at: float = 0.0
+        self._loaded_at: float = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._fingerprint is not None
+
+    @property
+    def fingerprint(self) -> tuple | None:
+        return self._fingerprint
+
+    def get_options(self, model: type) -> list[tuple[uuid.UUID, str]]:
+        """(id, name) 목록 (id 순서 = 생성 순서)"""
+        return list(self._names[model].items())
+
+    async def _get_fingerprint(self, db: AsyncSession) -> tuple:
+        """테이블별 (row 수, 최종 생성/수정 시각)을 한 번의 쿼리로 조회"""
+        stmt = union_all(
+            *(
+                select(
+                    literal(model.__tablename__).label("table_name"),
+                    func.count(model.id),
+                    func.max(func.coalesce(model.updated_at, model.created_at)),
+                )
+                for model in MASTER_DATA_MODELS
+            )
+        )
+        result = await db.execute(stmt)
+        return tuple(sorted(tuple(row) for row in result.all()))
+
+    async def load(self, db: AsyncSession) -> None:
+        """마스터 데이터 전체를 다시 읽어서 교체"""
+        async with self._lock:
+            fingerprint = await self._get_fingerprint(db)
+            names = {}
+            for model in MASTER_DATA_MODELS:
+                # uuid v7 id 순서로 읽어서 worker마다 같은 순서 유지
+                result = await db.execute(
+                    select(model.id, model.name).order_by(model.id)
+                )
+                names[model] = {row.id: row.name for row in result.all()}
+
+            self._names = names
+            self._fingerprint = fingerprint
+            self._checked_at = self._loaded_at = time.monotonic()
+        logger.info("master data registry loaded: %s", self._fingerprint)
+
+    async def refresh_if_changed(self, db: AsyncSession) -> None:
+        """
+        refresh_interval_seconds 마다 한 번만 fingerprint를 확인하고,
+        테이블 내용이 바뀐 경우에만 다시 로드
+        """
+        if not self.is_loaded:
+            await self.load(db)
+            return
+
+        if time.monotonic() - self._checked_at < self.refresh_interval_seconds:
+            return
+
+        self._checked_at = time.monotonic()
+        if await self._get_fingerprint(db) != self._fingerprint:
+            await self.load(db)
+
+    async def get_name(
+        self, db: AsyncSession, model: type, item_id: uuid.UUID | None
+    ) -> str | None:
+        """
+        id로 이름을 조회
+        메모리에 없는 id면(새로 추가된 행) 다시 로드 후 재조회
+        없는 id를 반복 요청해도 다시 로드는 refresh_interval_seconds 마다 한 번만
+        """
+        if item_id is None:
+            return None
+
+        await self.refresh_if_changed(db)
+        name = self._names[model].get(item_id)
+        if (
+            name is None
+            and time.monotonic() - self._loaded_at >= self.refresh_interval_seconds
+        ):
+            await self.load(db)
+            name = self._names[model].get(item_id)
+        return name
+
+
+master_data_registry = MasterDataRegistry(
+    refresh_interval_seconds=settings.MASTER_DATA_REFRESH_SECONDS
+)
@@ -0,0 +1,48 @@
+# app/core/principal_cache.py
+import time
+import uuid
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.models.user_model import User
+
+
+class PrincipalCache:
+    """
+    인증된 사용자(User + profile 관계) 객체를 user_id 기준으로 보관하는 TTL + LRU 캐시
+    세션에서 분리된(detached) 객체만 보관하므로 읽기 전용으로 사용
+    worker(프로세스)마다 따로 존재
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[uuid.UUID, tuple[float, User]] = OrderedDict()
+
+    def get(self, user_id: uuid.UUID) -> User | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return None
+
+        self._entries.move_to_end(user_id)
+        return user
+
+    def set(self, user_id: uuid.UUID, user: User) -> None:
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, user)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        self._entries.pop(user_id, None)
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+)
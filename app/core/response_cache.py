@@ -0,0 +1,52 @@
+# app/core/response_cache.py
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+
+class ResponseCache:
+    """
+    직렬화된 응답(bytes)을 TTL과 메모리 한도 안에서 보관하는 LRU 캐시
+    worker(프로세스)마다 따로 존재
+    """
+
+    def __init__(self, ttl_seconds: float, max_bytes: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[float, bytes]] = OrderedDict()
+        self._total_bytes = 0
+
+    def get(self, key: Hashable) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, body = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return body
+
+    def set(self, key: Hashable, body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, body)
+        self._total_bytes += len(body)
+
+        # 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+        while self._total_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        _, body = self._entries.pop(key)
+        self._total_bytes -= len(body)
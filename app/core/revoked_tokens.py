@@ -0,0 +1,55 @@
+# app/core/revoked_tokens.py
+import time
+import uuid
+
+from app.core.config import settings
+
+
+class RevokedTokenIndex:
+    """
+    폐기된 refresh token jti를 토큰 만료 시각(exp)까지 보관하는 메모리 인덱스
+    여기에 있으면 DB 조회 없이 갱신을 거절하고, 없으면 DB가 최종 판단
+    jti는 UUID 객체 대신 128bit 정수로 보관
+    worker(프로세스)마다 따로 존재
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: dict[int, float] = {}
+
+    def add(self, jti: uuid.UUID, expires_at: float) -> None:
+        if expires_at <= time.time():
+            return
+
+        self._entries[jti.int] = expires_at
+        # 가득 차면 가장 먼저 들어온 항목부터 제거 (DB가 최종 판단하므로 안전)
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def contains(self, jti: uuid.UUID) -> bool:
+        expires_at = self._entries.get(jti.int)
+        if expires_at is None:
+            return False
+
+        if expires_at <= time.time():
+            del self._entries[jti.int]
+            return False
+        return True
+
+    def prune(self) -> int:
+        """만료된 항목 제거 후 제거한 개수 반환"""
+        now = time.time()
+        expired = [
+            jti for jti, expires_at in self._entries.items() if expires_at <= now
+        ]
+        for jti in expired:
+            del self._entries[jti]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+revoked_token_index = RevokedTokenIndex(
+    max_entries=settings.REVOKED_TOKEN_INDEX_MAX_ENTRIES
+)
@@ -1,15 +1,83 @@
 # app/core/security.py
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
 from passlib.context import CryptContext
 
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
 # 비밀번호 해싱을 위한 컨텍스트 설정 (bcrypt 알고리즘 사용)
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증을 이벤트 루프 밖의 고정 크기 스레드 풀에서 실행
+    (bcrypt는 계산 중 GIL을 놓으므로 스레드로 병렬 처리 가능)
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._submitted = 0  # 제출되었지만 끝나지 않은 작업 (실행 중 + 대기)
+        self._running = 0
+        self._running_lock = threading.Lock()
+        self._max_queued = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """풀 사용량: queued가 계속 쌓이면 max_workers 부족"""
+        return {
+            "max_workers": self.max_workers,
+            "running": self._running,
+            "queued": self._submitted - self._running,
+            "max_queued": self._max_queued,
+        }
+
+    async def _run(self, func: Callable, *args):
+        self._submitted += 1
+        self._max_queued = max(self._max_queued, self._submitted - self._running)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._track, func, *args
+            )
+        finally:
+            self._submitted -= 1
+
+    def _track(self, func: Callable, *args):
+        # worker 스레드에서 실행 (+=/-=는 원자적이지 않으므로 lock으로 보호)
+        with self._running_lock:
+            self._running += 1
+        try:
+            return func(*args)
+        finally:
+            with self._running_lock:
+                self._running -= 1
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(pwd_context.verify, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(max_workers=settings.PASSWORD_HASH_WORKERS)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """일반 비밀번호와 해시된 비밀번호를 비교"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return await password_hasher.verify(plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
+async def get_password_hash(password: str) -> str:
     """일반 비밀번호를 해시하여 반환"""
-    return pwd_context.hash(password)
+    return await password_hasher.hash(password)
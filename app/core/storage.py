@@ -0,0 +1,356 @@
+# app/core/storage.py
+import asyncio
+import logging
+import mimetypes
+import os
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import boto3
+from botocore.exceptions import BotoCoreError, ClientError
+from fastapi import UploadFile
+
+from app.core.config import settings
+from app.exceptions.exceptions import (
+    InvalidImageUpload,
+    PresignedUploadNotSupported,
+    StorageError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class StorageBackend(ABC):
+    """
+    업로드 이미지 저장소 인터페이스 (key 예: uploads/{uuid}.{ext})
+    블로킹 I/O는 모두 전용 스레드 풀에서 실행하고,
+    동시에 진행하는 업로드 수를 max_concurrency로 제한
+    """
+
+    def __init__(self, base_url: str, max_concurrency: int, chunk_size: int):
+        self.base_url = base_url.rstrip("/") + "/"
+        self.chunk_size = chunk_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix=f"{type(self).__name__}",
+        )
+
+    async def _call(self, func, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(func, *args, **kwargs)
+        )
+
+    def get_url(self, key: str) -> str:
+        return self.base_url + key
+
+    @staticmethod
+    def _check_upload_size(uploaded_size: int, max_size: int) -> None:
+        # 프록시(nginx)의 body 크기 제한과 별개로 app에서도 확인
+        if uploaded_size > max_size:
+            raise InvalidImageUpload(
+                f"이미지는 {max_size // (1024 * 1024)}MB 이하만 업로드할 수 있습니다."
+            )
+
+    @abstractmethod
+    async def upload(
+        self, file: UploadFile, key: str, content_type: str | None, max_size: int
+    ):
+        """
+        UploadFile을 chunk_size 단위로 읽어서 저장
+        max_size를 넘으면 저장하던 내용을 지우고 InvalidImageUpload
+        """
+
+    @abstractmethod
+    async def put(self, key: str, body: bytes, content_type: str) -> None:
+        """메모리의 body를 한 번에 저장 (variant 등 작은 파일)"""
+
+    @abstractmethod
+    async def download(self, key: str) -> bytes:
+        """저장된 객체 전체를 읽어서 반환"""
+
+    @abstractmethod
+    async def get_content_type(self, key: str) -> str | None:
+        """저장된 객체의 Content-Type, 객체가 없으면 None"""
+
+    @abstractmethod
+    async def list_keys(self, prefix: str) -> list[str]:
+        """prefix(예: uploads/)로 시작하는 모든 key"""
+
+    def create_presigned_post(
+        self, key: str, content_type: str, max_size: int, expires_in: int
+    ) -> dict:
+        """클라이언트가 저장소로 직접 올릴 수 있는 {url, fields}"""
+        raise PresignedUploadNotSupported()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class S3StorageBackend(StorageBackend):
+    # S3 multipart upload의 마지막 part를 제외한 최소 크기
+    MIN_PART_SIZE = 5 * 1024 * 1024
+
+    def __init__(self, bucket: str, region: str, max_concurrency: int, part_size: int):
+        super().__init__(
+            base_url=f"https://{bucket}.s3.{region}.amazonaws.com",
+            max_concurrency=max_concurrency,
+            chunk_size=max(part_size, self.MIN_PART_SIZE),
+        )
+        self.bucket = bucket
+        self.region = region
+        self._client = None
+
+    @property
+    def client(self):
+        # import 시점이 아니라 처음 사용할 때 boto3 client 생성
+        if self._client is None:
+            self._client = boto3.client(
+                "s3",
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                region_name=self.region,
+            )
+        return self._client
+
+    async def _call_s3(self, method_name: str, **kwargs):
+        try:
+            return await self._call(
+                getattr(self.client, method_name), Bucket=self.bucket, **kwargs
+            )
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(f"S3 {method_name} failed: {e}") from e
+
+    async def upload(
+        self, file: UploadFile, key: str, content_type: str | None, max_size: int
+    ):
+        extra_args = {"ContentType": content_type} if content_type else {}
+        async with self._semaphore:
+            chunk = await file.read(self.chunk_size)
+            self._check_upload_size(len(chunk), max_size)
+            if len(chunk) < self.chunk_size:
+                # part 하나 크기보다 작으면 한 번에 업로드
+                await self._call_s3("put_object", Key=key, Body=chunk, **extra_args)
+                return
+
+            await self._upload_multipart(file, key, chunk, extra_args, max_size)
+
+    async def _upload_multipart(
+        self,
+        file: UploadFile,
+        key: str,
+        chunk: bytes,
+        extra_args: dict,
+        max_size: int,
+    ) -> None:
+        response = await self._call_s3("create_multipart_upload", Key=key, **extra_args)
+        upload_id = response["UploadId"]
+        parts = []
+        uploaded_size = len(chunk)
+        try:
+            while chunk:
+                part_number = len(parts) + 1
+                part = await self._call_s3(
+                    "upload_part",
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=chunk,
+                )
+                parts.append({"ETag": part["ETag"], "PartNumber": part_number})
+                chunk = await file.read(self.chunk_size)
+                uploaded_size += len(chunk)
+                self._check_upload_size(uploaded_size, max_size)
+
+            await self._call_s3(
+                "complete_multipart_upload",
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            # 실패(취소 포함)한 업로드의 part가 버킷에 남지 않도록 정리
+            await asyncio.shield(
+                self._call_s3("abort_multipart_upload", Key=key, UploadId=upload_id)
+            )
+            raise
+
+    async def put(self, key: str, body: bytes, content_type: str) -> None:
+        await self._call_s3("put_object", Key=key, Body=body, ContentType=content_type)
+
+    async def download(self, key: str) -> bytes:
+        response = await self._call_s3("get_object", Key=key)
+        with response["Body"] as body:
+            return await self._call(body.read)
+
+    async def get_content_type(self, key: str) -> str | None:
+        try:
+            head = await self._call_s3("head_object", Key=key)
+        except StorageError as e:
+            cause = e.__cause__
+            if isinstance(cause, ClientError) and cause.response.get("Error", {}).get(
+                "Code"
+            ) in ("404", "NoSuchKey"):
+                return None
+            raise
+        return head.get("ContentType")
+
+    def _list_keys(self, prefix: str) -> list[str]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        return [
+            obj["Key"]
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix)
+            for obj in page.get("Contents", [])
+        ]
+
+    async def list_keys(self, prefix: str) -> list[str]:
+        try:
+            return await self._call(self._list_keys, prefix)
+        except (BotoCoreError, ClientError) as e:
+            raise StorageError(f"S3 list_objects_v2 failed: {e}") from e
+
+    def create_presigned_post(
+        self, key: str, content_type: str, max_size: int, expires_in: int
+    ) -> dict:
+        # 서명만 로컬에서 계산하므로 네트워크 호출 없음
+        return self.client.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, max_size],
+            ],
+            ExpiresIn=expires_in,
+        )
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    로컬 디스크 저장소: root_dir/{key}에 저장하고 nginx가 base_url로 직접 서빙
+    임시 파일에 쓴 뒤 rename하므로 읽는 쪽에서 덜 쓰인 파일을 볼 일이 없음
+    """
+
+    def __init__(
+        self, root_dir: str, base_url: str, max_concurrency: int, chunk_size: int
+    ):
+        super().__init__(
+            base_url=base_url, max_concurrency=max_concurrency, chunk_size=chunk_size
+        )
+        self.root_dir = os.path.realpath(os.path.expanduser(root_dir))
+
+    def _get_path(self, key: str) -> str:
+        path = os.path.realpath(os.path.join(self.root_dir, key))
+        if os.path.commonpath([self.root_dir, path]) != self.root_dir:
+            raise StorageError(f"Invalid storage key: {key}")
+        return path
+
+    def _open_temp_file(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        return temp_path, open(temp_path, "wb")
+
+    def _discard_temp_file(self, temp_file, temp_path: str) -> None:
+        temp_file.close()
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    def _commit_temp_file(self, temp_file, temp_path: str, path: str) -> None:
+        temp_file.close()
+        os.replace(temp_path, path)
+
+    async def upload(
+        self, file: UploadFile, key: str, content_type: str | None, max_size: int
+    ):
+        path = self._get_path(key)
+        async with self._semaphore:
+            try:
+                temp_path, temp_file = await self._call(self._open_temp_file, path)
+            except OSError as e:
+                raise StorageError(f"Failed to open {key}: {e}") from e
+
+            uploaded_size = 0
+            try:
+                while chunk := await file.read(self.chunk_size):
+                    uploaded_size += len(chunk)
+                    self._check_upload_size(uploaded_size, max_size)
+                    await self._call(temp_file.write, chunk)
+                await self._call(self._commit_temp_file, temp_file, temp_path, path)
+            except BaseException as e:
+                await asyncio.shield(
+                    self._call(self._discard_temp_file, temp_file, temp_path)
+                )
+                if isinstance(e, OSError):
+                    raise StorageError(f"Failed to write {key}: {e}") from e
+                raise
+
+    def _write_file(self, path: str, body: bytes) -> None:
+        temp_path, temp_file = self._open_temp_file(path)
+        try:
+            temp_file.write(body)
+        except BaseException:
+            self._discard_temp_file(temp_file, temp_path)
+            raise
+        self._commit_temp_file(temp_file, temp_path, path)
+
+    def _read_file(self, path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    async def put(self, key: str, body: bytes, content_type: str) -> None:
+        try:
+            await self._call(self._write_file, self._get_path(key), body)
+        except OSError as e:
+            raise StorageError(f"Failed to write {key}: {e}") from e
+
+    async def download(self, key: str) -> bytes:
+        try:
+            return await self._call(self._read_file, self._get_path(key))
+        except OSError as e:
+            raise StorageError(f"Failed to read {key}: {e}") from e
+
+    def _list_keys(self, prefix: str) -> list[str]:
+        # 로컬 저장소의 prefix는 디렉터리 (uploads/)
+        keys = []
+        for dir_path, _, filenames in os.walk(self._get_path(prefix)):
+            for filename in filenames:
+                if filename.endswith(".tmp"):  # 아직 쓰는 중인 임시 파일
+                    continue
+                path = os.path.join(dir_path, filename)
+                keys.append(os.path.relpath(path, self.root_dir).replace(os.sep, "/"))
+        return keys
+
+    async def list_keys(self, prefix: str) -> list[str]:
+        try:
+            return await self._call(self._list_keys, prefix)
+        except OSError as e:
+            raise StorageError(f"Failed to list {prefix}: {e}") from e
+
+    async def get_content_type(self, key: str) -> str | None:
+        path = self._get_path(key)
+        if not await self._call(os.path.isfile, path):
+            return None
+        # nginx도 확장자로 Content-Type을 정하므로 같은 기준 사용
+        content_type, _ = mimetypes.guess_type(path)
+        return content_type
+
+
+def create_storage_backend() -> StorageBackend:
+    if settings.STORAGE_BACKEND == "local":
+        return LocalStorageBackend(
+            root_dir=settings.IMAGE_UPLOAD_DIR,
+            base_url=settings.IMAGE_BASE_URL,
+            max_concurrency=settings.STORAGE_UPLOAD_CONCURRENCY,
+            chunk_size=settings.STORAGE_UPLOAD_CHUNK_SIZE,
+        )
+    return S3StorageBackend(
+        bucket=settings.AWS_S3_BUCKET,
+        region=settings.AWS_REGION,
+        max_concurrency=settings.STORAGE_UPLOAD_CONCURRENCY,
+        part_size=settings.STORAGE_UPLOAD_CHUNK_SIZE,
+    )
+
+
+storage = create_storage_backend()
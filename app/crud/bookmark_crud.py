@@ -6,6 +6,10 @@ from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.crud.counter_crud import (
+    change_post_bookmarks_count,
+    change_user_bookmark_count,
+)
 from app.models import PostBookmark, RecruitingPost, User, UserBookmark
 
 
@@ -34,8 +38,9 @@ async def add_user_bookmark(
         user_id=current_user_id, bookmarked_user_id=bookmarked_user_id
     )
 
-    target_user.bookmark_count += 1
     db.add(user_bookmark)
+    await db.flush()
+    await change_user_bookmark_count(db, bookmarked_user_id, 1)
     await db.commit()
 
 
@@ -50,8 +55,10 @@ async def delete_user_bookmark(
         UserBookmark.bookmarked_user_id == bookmarked_user_id,
     )
 
-    target_user.bookmark_count -= 1
-    await db.execute(stmt)
+    result = await db.execute(stmt)
+    # 실제로 삭제된 경우에만 감소 (동시 삭제 요청 중복 차감 방지)
+    if result.rowcount:
+        await change_user_bookmark_count(db, bookmarked_user_id, -result.rowcount)
     await db.commit()
 
 
@@ -104,10 +111,9 @@ async def add_post_bookmark(
         user_id=current_user_id, bookmarked_post_id=bookmarked_post_id
     )
 
-    # postcode_stmt = select(func.count(PostBookmark.id)).where(PostBookmark.bookmarked_post_id == bookmarked_post_id)
-    post.bookmarks_count += 1
-
     db.add(post_bookmark)
+    await db.flush()
+    await change_post_bookmarks_count(db, bookmarked_post_id, 1)
     await db.commit()
 
 
@@ -122,6 +128,8 @@ async def delete_post_bookmark(
         PostBookmark.bookmarked_post_id == bookmarked_post_id,
     )
 
-    post.bookmarks_count -= 1
-    await db.execute(stmt)
+    result = await db.execute(stmt)
+    # 실제로 삭제된 경우에만 감소 (동시 삭제 요청 중복 차감 방지)
+    if result.rowcount:
+        await change_post_bookmarks_count(db, bookmarked_post_id, -result.rowcount)
     await db.commit()
@@ -1,23 +1,37 @@
 import uuid
+from datetime import datetime
 
+from sqlalchemy import delete, func, literal, true
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlmodel import or_, select, tuple_
+from sqlalchemy.orm import aliased, selectinload
+from sqlmodel import select, tuple_
 
+from app.core.config import settings
+from app.core.cursor import encode_cursor
+from app.crud.counter_crud import change_post_comments_count
 from app.models import (
     Comment,
+    Profile,
     RecruitingPost,
     User,
 )
 from app.schemas.comment_schema import (
+    GetChildCommentCursorResponse,
     GetChildCommentResponse,
     GetCommentCursorResponse,
     GetCommentListResponse,
     GetCommentRecruitingResponse,
+    GetCommentThreadCursorResponse,
+    GetCommentThreadResponse,
     UpdateCommentRequest,
 )
 from app.schemas.recruiting_schema import GetUserProfileResponse
 
+# materialized path 한 단계의 길이 (uuid.hex)
+COMMENT_PATH_SEGMENT_LENGTH = 32
+# path 범위 검색의 상한: hex 문자(0-9a-f)보다 뒤에 정렬되는 문자
+COMMENT_PATH_UPPER_BOUND_CHAR = "g"
+
 
 async def get_comment_by_id(db: AsyncSession, comment_id: uuid.UUID) -> Comment | None:
     """
@@ -35,92 +49,220 @@ async def get_comment_by_id(db: AsyncSession, comment_id: uuid.UUID) -> Comment
     return result.scalars().one_or_none()
 
 
-# FR-019: 댓글 목록 조회
-async def get_comment_list(
-    db: AsyncSession,
-    post_id: uuid.UUID,
-    current_user_id: uuid.UUID,
-    author: uuid.UUID,
-    limit: int,
-    cursor: uuid.UUID,
-) -> GetCommentCursorResponse:
+async def get_comment_brief(db: AsyncSession, comment_id: uuid.UUID):
+    """
+    id로 댓글의 (id, post_id, user_id, parent_comment_id, path)만 조회합니다.
+    대댓글/구인글을 로드하지 않는 존재 확인용
+    """
+    stmt = select(
+        Comment.id,
+        Comment.post_id,
+        Comment.user_id,
+        Comment.parent_comment_id,
+        Comment.path,
+    ).where(Comment.id == comment_id)
+    result = await db.execute(stmt)
+    return result.one_or_none()
+
+
+def build_comment_path(parent_path: str | None, comment_id: uuid.UUID) -> str:
+    """
+    materialized path: 조상부터 자신까지 id(UUIDv7, 32자리 hex)를 이어 붙임
+    고정 길이 + 시간순 id라서 path 정렬 = 스레드 순서(부모 다음에 자식, 형제는 작성순)
+    """
+    return (parent_path or "") + comment_id.hex
+
 
-    stmt = select(Comment).where(
-        or_(Comment.post_id == post_id, Comment.user_id == author)
+def get_comment_depth(path: str) -> int:
+    """최상위 댓글이 1"""
+    return len(path) // COMMENT_PATH_SEGMENT_LENGTH
+
+
+def encode_reply_cursor(
+    parent_comment_id: uuid.UUID, created_at: datetime, comment_id: uuid.UUID
+) -> str:
+    """parent_comment_id도 함께 서명해서 다른 댓글의 대댓글 목록에서 재사용을 막음"""
+    return encode_cursor(
+        {
+            "parent_comment_id": str(parent_comment_id),
+            "created_at": created_at.isoformat(),
+            "id": str(comment_id),
+        }
     )
 
-    if post_id:
-        stmt = stmt.where(Comment.parent_comment_id.is_(None))
 
-    if cursor:
-        cursor_subquery = (
-            select(Comment.created_at).where(Comment.id == cursor).scalar_subquery()
-        )
-        stmt = stmt.where(
-            tuple_(Comment.created_at, Comment.id) <= tuple_(cursor_subquery, cursor)
+def select_child_comment_columns():
+    """대댓글 응답에 필요한 컬럼(작성자 닉네임/프로필 이미지 포함)만 조회"""
+    return (
+        select(
+            Comment.id,
+            Comment.parent_comment_id,
+            Comment.content,
+            Comment.created_at,
+            Comment.user_id,
+            User.nickname.label("author_nickname"),
+            Profile.image_url.label("author_image_url"),
         )
+        .join(User, Comment.user_id == User.id)
+        .outerjoin(Profile, Profile.user_id == User.id)
+    )
+
 
-    stmt = stmt.options(
-        selectinload(Comment.post),
-        selectinload(Comment.author),
-        selectinload(Comment.author).selectinload(User.profile),
-        selectinload(Comment.children),
-        selectinload(Comment.children).selectinload(Comment.author),
-        selectinload(Comment.children)
-        .selectinload(Comment.author)
-        .selectinload(User.profile),
+def build_child_comment_response(
+    row, current_user_id: uuid.UUID | None
+) -> GetChildCommentResponse:
+    return GetChildCommentResponse(
+        id=row.id,
+        content=row.content,
+        created_at=row.created_at,
+        is_owner=row.user_id == current_user_id,
+        author=GetUserProfileResponse(
+            id=row.user_id,
+            nickname=row.author_nickname,
+            image_url=row.author_image_url,
+        ),
     )
 
-    final_query = stmt.order_by(Comment.created_at.desc(), Comment.id.desc()).limit(
-        limit + 1
+
+async def get_reply_previews_by_parent_ids(
+    db: AsyncSession,
+    parent_ids: list[uuid.UUID],
+    current_user_id: uuid.UUID | None,
+    preview_size: int,
+) -> tuple[dict[uuid.UUID, int], dict[uuid.UUID, list[GetChildCommentResponse]]]:
+    """
+    부모 댓글들의 대댓글 개수와 최신 대댓글 preview_size개를 조회합니다.
+    부모마다 LATERAL + LIMIT으로 읽으므로 대댓글이 많아도 조회량은 고정
+    """
+    counts_by_parent_id = {parent_id: 0 for parent_id in parent_ids}
+    previews_by_parent_id = {parent_id: [] for parent_id in parent_ids}
+    if not parent_ids:
+        return counts_by_parent_id, previews_by_parent_id
+
+    # 대댓글 개수: query+=1
+    count_stmt = (
+        select(Comment.parent_comment_id, func.count(Comment.id))
+        .where(Comment.parent_comment_id.in_(parent_ids))
+        .group_by(Comment.parent_comment_id)
+    )
+    for parent_id, children_count in (await db.execute(count_stmt)).all():
+        counts_by_parent_id[parent_id] = children_count
+
+    # 부모별 최신 대댓글: query+=1
+    parent = aliased(Comment)
+    preview = (
+        select_child_comment_columns()
+        .where(Comment.parent_comment_id == parent.id)
+        .order_by(Comment.created_at.desc(), Comment.id.desc())
+        .limit(preview_size)
+        .lateral("preview")
+    )
+    preview_stmt = (
+        select(preview)
+        .select_from(parent)
+        .join(preview, true())
+        .where(parent.id.in_(parent_ids))
+        .order_by(preview.c.created_at.desc(), preview.c.id.desc())
+    )
+    for row in (await db.execute(preview_stmt)).all():
+        previews_by_parent_id[row.parent_comment_id].append(
+            build_child_comment_response(row, current_user_id)
+        )
+
+    return counts_by_parent_id, previews_by_parent_id
+
+
+def select_comment_list_columns():
+    """댓글 목록 응답에 필요한 컬럼(구인글 제목, 작성자 포함)만 조회"""
+    return (
+        select(
+            Comment.id,
+            Comment.content,
+            Comment.created_at,
+            Comment.user_id,
+            Comment.post_id,
+            RecruitingPost.title.label("post_title"),
+            User.nickname.label("author_nickname"),
+            Profile.image_url.label("author_image_url"),
+        )
+        .join(RecruitingPost, Comment.post_id == RecruitingPost.id)
+        .join(User, Comment.user_id == User.id)
+        .outerjoin(Profile, Profile.user_id == User.id)
     )
 
-    result = await db.execute(final_query)
-    comments = result.scalars().all()
+
+async def get_comment_list_page(
+    db: AsyncSession,
+    stmt,
+    current_user_id: uuid.UUID | None,
+    limit: int,
+    cursor: tuple[datetime, uuid.UUID] | None,
+    cursor_scope: dict,
+) -> GetCommentCursorResponse:
+    """
+    (created_at, id) DESC keyset으로 한 페이지를 조회하고 응답으로 변환합니다.
+    cursor_scope는 next_cursor에 함께 서명되어 다른 목록에서 재사용을 막음
+    """
+    # cursor에 담긴 (created_at, id) 이후부터 (추가 쿼리 없음)
+    if cursor:
+        keyset_columns = (Comment.created_at, Comment.id)
+        stmt = stmt.where(
+            tuple_(*keyset_columns)
+            < tuple_(
+                *(
+                    literal(value, column.type)
+                    for column, value in zip(keyset_columns, cursor)
+                )
+            )
+        )
+
+    stmt = stmt.order_by(Comment.created_at.desc(), Comment.id.desc()).limit(limit + 1)
+    rows = (await db.execute(stmt)).all()
 
     next_cursor = None
-    if len(comments) == limit + 1:
-        next_cursor = comments[-1].id
-        comments = comments[:-1]
-    print("조회된 갯수:", len(comments))
+    if len(rows) == limit + 1:
+        rows = rows[:-1]
+        next_cursor = encode_cursor(
+            {
+                **cursor_scope,
+                "created_at": rows[-1].created_at.isoformat(),
+                "id": str(rows[-1].id),
+            }
+        )
+
+    children_counts, children_previews = await get_reply_previews_by_parent_ids(
+        db,
+        [row.id for row in rows],
+        current_user_id,
+        settings.COMMENT_REPLY_PREVIEW_SIZE,
+    )
 
     comment_list = []
-    if comments:
-        for comment in comments:
-            comment_dict = comment.model_dump()
-
-            if comment.children:
-                comment_dict["children"] = [
-                    GetChildCommentResponse(
-                        id=child.id,
-                        content=child.content,
-                        created_at=child.created_at,
-                        is_owner=child.user_id == current_user_id,
-                        author=GetUserProfileResponse(
-                            id=child.user_id,
-                            nickname=child.author.nickname,
-                            image_url=(
-                                child.author.profile.image_url
-                                if child.author.profile
-                                else None
-                            ),
-                        ),
-                    )
-                    for child in comment.children
-                ]
-            comment_dict["post"] = GetCommentRecruitingResponse.model_validate(
-                comment.post
+    for row in rows:
+        children = children_previews[row.id]
+        children_next_cursor = None
+        if children and children_counts[row.id] > len(children):
+            children_next_cursor = encode_reply_cursor(
+                row.id, children[-1].created_at, children[-1].id
             )
-            comment_dict["is_owner"] = comment.user_id == current_user_id
-            comment_dict["author"] = GetUserProfileResponse(
-                id=comment.author.id,
-                nickname=comment.author.nickname,
-                image_url=(
-                    comment.author.profile.image_url if comment.author.profile else None
+
+        comment_list.append(
+            GetCommentListResponse(
+                id=row.id,
+                content=row.content,
+                created_at=row.created_at,
+                post=GetCommentRecruitingResponse(id=row.post_id, title=row.post_title),
+                is_owner=row.user_id == current_user_id,
+                author=GetUserProfileResponse(
+                    id=row.user_id,
+                    nickname=row.author_nickname,
+                    image_url=row.author_image_url,
                 ),
+                children=children or None,
+                children_count=children_counts[row.id],
+                children_next_cursor=children_next_cursor,
             )
-            get_comment = GetCommentListResponse.model_validate(comment_dict)
-            comment_list.append(get_comment)
+        )
 
     return GetCommentCursorResponse(
         next_cursor=next_cursor,
@@ -128,6 +270,133 @@ async def get_comment_list(
     )
 
 
+# FR-019: 댓글 목록 조회 (구인글의 최상위 댓글)
+async def get_post_comment_list(
+    db: AsyncSession,
+    post_id: uuid.UUID,
+    current_user_id: uuid.UUID | None,
+    limit: int,
+    cursor: tuple[datetime, uuid.UUID] | None,
+) -> GetCommentCursorResponse:
+    # ix_comments_post_id_created_at_id_top_level
+    stmt = select_comment_list_columns().where(
+        Comment.post_id == post_id,
+        Comment.parent_comment_id.is_(None),
+    )
+    return await get_comment_list_page(
+        db, stmt, current_user_id, limit, cursor, {"post_id": str(post_id)}
+    )
+
+
+# FR-019: 댓글 목록 조회 (작성자의 댓글, 대댓글 포함)
+async def get_author_comment_list(
+    db: AsyncSession,
+    author: uuid.UUID,
+    current_user_id: uuid.UUID | None,
+    limit: int,
+    cursor: tuple[datetime, uuid.UUID] | None,
+) -> GetCommentCursorResponse:
+    # ix_comments_user_id_created_at_id
+    stmt = select_comment_list_columns().where(Comment.user_id == author)
+    return await get_comment_list_page(
+        db, stmt, current_user_id, limit, cursor, {"author": str(author)}
+    )
+
+
+# 대댓글 목록 조회
+async def get_reply_list(
+    db: AsyncSession,
+    parent_comment_id: uuid.UUID,
+    current_user_id: uuid.UUID | None,
+    limit: int,
+    cursor: tuple[datetime, uuid.UUID] | None,
+) -> GetChildCommentCursorResponse:
+
+    stmt = select_child_comment_columns().where(
+        Comment.parent_comment_id == parent_comment_id
+    )
+
+    # cursor에 담긴 (created_at, id) 이후부터 (추가 쿼리 없음)
+    if cursor:
+        keyset_columns = (Comment.created_at, Comment.id)
+        stmt = stmt.where(
+            tuple_(*keyset_columns)
+            < tuple_(
+                *(
+                    literal(value, column.type)
+                    for column, value in zip(keyset_columns, cursor)
+                )
+            )
+        )
+
+    stmt = stmt.order_by(Comment.created_at.desc(), Comment.id.desc()).limit(limit + 1)
+    rows = (await db.execute(stmt)).all()
+
+    next_cursor = None
+    if len(rows) == limit + 1:
+        rows = rows[:-1]
+        next_cursor = encode_reply_cursor(
+            parent_comment_id, rows[-1].created_at, rows[-1].id
+        )
+
+    return GetChildCommentCursorResponse(
+        next_cursor=next_cursor,
+        children=[build_child_comment_response(row, current_user_id) for row in rows],
+    )
+
+
+# 댓글 스레드(하위 트리) 조회
+async def get_comment_thread(
+    db: AsyncSession,
+    root_path: str,
+    current_user_id: uuid.UUID | None,
+    limit: int,
+    cursor: str | None,
+) -> GetCommentThreadCursorResponse:
+    """
+    root_path 댓글과 모든 하위 댓글을 path 순서로 조회합니다.
+    ix_comments_path 범위 스캔 한 번 (cursor는 마지막으로 받은 path)
+    """
+    stmt = (
+        select_child_comment_columns()
+        .add_columns(Comment.path)
+        .where(
+            Comment.path >= root_path,
+            Comment.path < root_path + COMMENT_PATH_UPPER_BOUND_CHAR,
+        )
+    )
+    if cursor:
+        stmt = stmt.where(Comment.path > cursor)
+
+    stmt = stmt.order_by(Comment.path).limit(limit + 1)
+    rows = (await db.execute(stmt)).all()
+
+    next_cursor = None
+    if len(rows) == limit + 1:
+        rows = rows[:-1]
+        next_cursor = encode_cursor({"path": rows[-1].path})
+
+    return GetCommentThreadCursorResponse(
+        next_cursor=next_cursor,
+        comments=[
+            GetCommentThreadResponse(
+                id=row.id,
+                parent_comment_id=row.parent_comment_id,
+                content=row.content,
+                created_at=row.created_at,
+                depth=get_comment_depth(row.path),
+                is_owner=row.user_id == current_user_id,
+                author=GetUserProfileResponse(
+                    id=row.user_id,
+                    nickname=row.author_nickname,
+                    image_url=row.author_image_url,
+                ),
+            )
+            for row in rows
+        ],
+    )
+
+
 # FR-020: 댓글 수정
 async def update_comment_content(
     db: AsyncSession,
@@ -139,13 +408,16 @@ async def update_comment_content(
 
 
 # FR-021: 댓글 삭제
-async def delete_comment(
-    db: AsyncSession,
-    comment: Comment,
-    post: RecruitingPost,
-) -> None:
-    children = len(comment.children)
-    post.comments_count -= children + 1
-
-    await db.delete(comment)  # 자식 댓글 delete-orphan
+async def delete_comment(db: AsyncSession, comment) -> None:
+    """
+    댓글과 하위 댓글(path 범위)을 한 번에 삭제하고
+    삭제된 수만큼 comments_count를 감소 (같은 트랜잭션)
+    """
+    stmt = delete(Comment).where(
+        Comment.path >= comment.path,
+        Comment.path < comment.path + COMMENT_PATH_UPPER_BOUND_CHAR,
+    )
+    result = await db.execute(stmt)
+    if result.rowcount:
+        await change_post_comments_count(db, comment.post_id, -result.rowcount)
     await db.commit()
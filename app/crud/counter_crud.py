@@ -0,0 +1,133 @@
+# app/crud/counter_crud.py
+import uuid
+
+from sqlalchemy import Column, exists, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Comment,
+    PostBookmark,
+    RecruitingPostStats,
+    User,
+    UserBookmark,
+)
+
+recruiting_post_stats_table = RecruitingPostStats.__table__
+users_table = User.__table__
+
+# (집계 컬럼, 원본 테이블의 FK 컬럼)
+COUNTER_SOURCES = (
+    (recruiting_post_stats_table.c.comments_count, Comment.__table__.c.post_id),
+    (
+        recruiting_post_stats_table.c.bookmarks_count,
+        PostBookmark.__table__.c.bookmarked_post_id,
+    ),
+    (users_table.c.bookmark_count, UserBookmark.__table__.c.bookmarked_user_id),
+)
+
+
+def get_counter_values(counter_column: Column, value) -> dict:
+    """SET 절: 집계 변경은 수정이 아니므로 updated_at(onupdate)이 있으면 유지"""
+    table = counter_column.table
+    values = {counter_column.name: value}
+    if "updated_at" in table.c:
+        values["updated_at"] = table.c.updated_at
+    return values
+
+
+def get_counter_key_column(counter_column: Column) -> Column:
+    """카운터 테이블의 PK (recruiting_post_stats.post_id, users.id)"""
+    (key_column,) = counter_column.table.primary_key.columns
+    return key_column
+
+
+async def change_counter(
+    db: AsyncSession, counter_column: Column, row_id: uuid.UUID, delta: int
+) -> int | None:
+    """
+    UPDATE ... SET x = x + delta ... RETURNING x 한 문장으로 카운터를 변경합니다.
+    호출한 쪽의 트랜잭션 안에서 실행되고(commit은 호출한 쪽), 행이 없으면 None
+    """
+    stmt = (
+        update(counter_column.table)
+        .where(get_counter_key_column(counter_column) == row_id)
+        .values(get_counter_values(counter_column, counter_column + delta))
+        .returning(counter_column)
+    )
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def change_post_comments_count(
+    db: AsyncSession, post_id: uuid.UUID, delta: int
+) -> int | None:
+    return await change_counter(
+        db, recruiting_post_stats_table.c.comments_count, post_id, delta
+    )
+
+
+async def change_post_bookmarks_count(
+    db: AsyncSession, post_id: uuid.UUID, delta: int
+) -> int | None:
+    return await change_counter(
+        db, recruiting_post_stats_table.c.bookmarks_count, post_id, delta
+    )
+
+
+async def change_user_bookmark_count(
+    db: AsyncSession, user_id: uuid.UUID, delta: int
+) -> int | None:
+    return await change_counter(db, users_table.c.bookmark_count, user_id, delta)
+
+
+async def reconcile_counter(
+    db: AsyncSession, counter_column: Column, source_column: Column
+) -> int:
+    """
+    원본 테이블에서 다시 집계한 값과 다른 행만 set-based UPDATE 두 번으로 보정합니다.
+    보정한 행 수를 반환
+    """
+    table = counter_column.table
+    key_column = get_counter_key_column(counter_column)
+
+    # 1) 원본 행이 있는 대상: GROUP BY 결과와 join
+    counts = (
+        select(source_column.label("row_id"), func.count().label("total"))
+        .group_by(source_column)
+        .subquery()
+    )
+    update_counted_stmt = (
+        update(table)
+        .where(
+            key_column == counts.c.row_id,
+            counter_column != counts.c.total,
+        )
+        .values(get_counter_values(counter_column, counts.c.total))
+    )
+
+    # 2) 원본 행이 하나도 없는 대상: 0으로
+    update_empty_stmt = (
+        update(table)
+        .where(
+            counter_column != 0,
+            ~exists().where(source_column == key_column),
+        )
+        .values(get_counter_values(counter_column, 0))
+    )
+
+    counted_result = await db.execute(update_counted_stmt)
+    empty_result = await db.execute(update_empty_stmt)
+    return counted_result.rowcount + empty_result.rowcount
+
+
+async def reconcile_all_counters(db: AsyncSession) -> dict[str, int]:
+    """
+    comments / post_bookmarks / user_bookmarks 기준으로 모든 카운터를 다시 계산합니다.
+    {"recruiting_post_stats.comments_count": 보정한 행 수, ...}
+    """
+    reconciled = {}
+    for counter_column, source_column in COUNTER_SOURCES:
+        reconciled[str(counter_column)] = await reconcile_counter(
+            db, counter_column, source_column
+        )
+    return reconciled
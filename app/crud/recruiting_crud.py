@@ -1,11 +1,15 @@
 import logging
 import uuid
 
-from sqlalchemy import delete
+from sqlalchemy import delete, func, literal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from sqlmodel import and_, desc, or_, select, tuple_
+from sqlalchemy.orm import defer, load_only, selectinload
+from sqlmodel import and_, desc, select, tuple_
 
+from app.core.cursor import encode_cursor
+from app.core.master_data import master_data_registry
+from app.crud.comment_crud import build_comment_path
+from app.crud.counter_crud import change_post_comments_count
 from app.models import (
     Comment,
     ExperienceLevel,
@@ -13,16 +17,18 @@ from app.models import (
     Orientation,
     Position,
     PostBookmark,
+    Profile,
     RecruitingPost,
     RecruitingPostGenreLink,
     RecruitingPostPositionLink,
     RecruitingPostRegionLink,
+    RecruitingPostStats,
     RecruitmentType,
     Region,
     User,
 )
 from app.schemas.comment_schema import CreateCommentRequest
-from app.schemas.enums import SortBy
+from app.schemas.enums import RecruitingLoadProfile, SortBy
 from app.schemas.recruiting_schema import (
     GetGenreResponse,
     GetOrientationResponse,
@@ -30,12 +36,19 @@ from app.schemas.recruiting_schema import (
     GetRecruitingCursorResponse,
     GetRecruitingDetailResponse,
     GetRecruitingListResponse,
+    GetRecruitmentTypeResponse,
+    GetUserProfileResponse,
     RecruitingDetailRequest,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def escape_like(value: str) -> str:
+    """LIKE 패턴의 특수문자(%, _)를 일반 문자로 검색하도록 escape"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 async def get_user_by_id(db: AsyncSession, author: uuid.UUID) -> RecruitingPost | None:
     """
     id로 사용자를 조회합니다.
@@ -45,35 +58,136 @@ async def get_user_by_id(db: AsyncSession, author: uuid.UUID) -> RecruitingPost
     return result.scalar_one_or_none()
 
 
+def get_recruiting_load_options(load_profile: RecruitingLoadProfile) -> tuple:
+    """load_profile 별로 필요한 컬럼/관계만 로드하는 옵션"""
+    if load_profile == RecruitingLoadProfile.EXISTENCE:
+        return (load_only(RecruitingPost.id),)
+    if load_profile == RecruitingLoadProfile.OWNERSHIP:
+        return (load_only(RecruitingPost.id, RecruitingPost.user_id),)
+    return (
+        defer(RecruitingPost.search_document),
+        selectinload(RecruitingPost.author).selectinload(User.profile),
+        selectinload(RecruitingPost.regions),
+        selectinload(RecruitingPost.genres),
+        selectinload(RecruitingPost.stats),
+    )
+
+
 async def get_recruiting_by_id(
-    db: AsyncSession, post_id: uuid.UUID
+    db: AsyncSession,
+    post_id: uuid.UUID,
+    load_profile: RecruitingLoadProfile = RecruitingLoadProfile.EXISTENCE,
 ) -> RecruitingPost | None:
     """
     id로 구인글을 조회합니다.
+    load_profile로 필요한 만큼만 로드 (댓글/북마크 목록은 로드하지 않음)
     """
     stmt = (
         select(RecruitingPost)
-        .options(
-            selectinload(RecruitingPost.author),
-            selectinload(RecruitingPost.author).selectinload(User.profile),
-            selectinload(RecruitingPost.comments),
-            selectinload(RecruitingPost.regions),
-            selectinload(RecruitingPost.genres),
-            selectinload(RecruitingPost.positions),
-            selectinload(RecruitingPost.bookmarks),
-        )
+        .options(*get_recruiting_load_options(load_profile))
         .where(RecruitingPost.id == post_id)
     )
     result = await db.execute(stmt)
     return result.scalars().first()
 
 
+async def get_positions_by_post_ids(
+    db: AsyncSession, post_ids: list[uuid.UUID]
+) -> dict[uuid.UUID, list[GetPositionResponse]]:
+    """
+    여러 구인글의 모집 포지션/희망 경력을 한 번의 IN 쿼리로 조회해서
+    post_id 별로 묶어 반환합니다.
+    """
+    positions_by_post_id = {post_id: [] for post_id in post_ids}
+    if not post_ids:
+        return positions_by_post_id
+
+    positions_stmt = (
+        select(
+            RecruitingPostPositionLink.post_id,
+            RecruitingPostPositionLink.position_id,
+            Position.name.label("position_name"),
+            RecruitingPostPositionLink.desired_experience_level_id.label(
+                "experienced_level_id"
+            ),
+            ExperienceLevel.name.label("experienced_level_name"),
+        )
+        .join(Position, RecruitingPostPositionLink.position_id == Position.id)
+        .join(
+            ExperienceLevel,
+            RecruitingPostPositionLink.desired_experience_level_id
+            == ExperienceLevel.id,
+        )
+        .where(RecruitingPostPositionLink.post_id.in_(post_ids))
+        # 응답 순서가 요청마다 바뀌지 않도록 정렬 (PK (post_id, position_id) 순서)
+        .order_by(
+            RecruitingPostPositionLink.post_id, RecruitingPostPositionLink.position_id
+        )
+    )
+
+    # [(post_id, position_id, '키보드', experienced_level_id, '프로'), ...]
+    positions_result = (await db.execute(positions_stmt)).all()
+    for p in positions_result:
+        positions_by_post_id[p.post_id].append(GetPositionResponse.model_validate(p))
+
+    return positions_by_post_id
+
+
+async def get_master_data_by_post_ids(
+    db: AsyncSession,
+    post_ids: list[uuid.UUID],
+    link_post_id_column,
+    link_item_id_column,
+    master_model: type,
+) -> dict[uuid.UUID, list[dict]]:
+    """
+    구인글-마스터 데이터 연결 테이블(지역, 장르)을 한 번의 IN 쿼리로 조회하고
+    이름은 마스터 데이터 registry에서 채워 post_id 별로 묶어 반환합니다.
+    """
+    items_by_post_id = {post_id: [] for post_id in post_ids}
+    if not post_ids:
+        return items_by_post_id
+
+    # 응답 순서가 요청마다 바뀌지 않도록 정렬 (PK (post_id, item_id) 순서)
+    link_stmt = (
+        select(link_post_id_column, link_item_id_column)
+        .where(link_post_id_column.in_(post_ids))
+        .order_by(link_post_id_column, link_item_id_column)
+    )
+    for post_id, item_id in (await db.execute(link_stmt)).all():
+        items_by_post_id[post_id].append(
+            {
+                "id": item_id,
+                "name": await master_data_registry.get_name(db, master_model, item_id),
+            }
+        )
+
+    return items_by_post_id
+
+
+async def get_bookmarked_post_ids(
+    db: AsyncSession, current_user_id: uuid.UUID, post_ids: list[uuid.UUID]
+) -> set[uuid.UUID]:
+    """
+    post_ids 중 현재 사용자가 북마크한 구인글 id만 반환합니다.
+    """
+    if not post_ids:
+        return set()
+
+    bookmarked_post_id_stmt = select(PostBookmark.bookmarked_post_id).where(
+        PostBookmark.user_id == current_user_id,
+        PostBookmark.bookmarked_post_id.in_(post_ids),
+    )
+    bookmarked_posts_result = await db.execute(bookmarked_post_id_stmt)
+    return set(bookmarked_posts_result.scalars().all())
+
+
 # FR-011: 구인글 목록 조회
 async def get_recruiting_list(
     db: AsyncSession,
     current_user_id: uuid.UUID,
     limit: int,
-    cursor: uuid.UUID | None,
+    cursor: tuple | None,
     author: uuid.UUID | None,
     bookmarks: str | None,
     search_query: str | None,
@@ -83,31 +197,54 @@ async def get_recruiting_list(
     position_ids: list[uuid.UUID] | None,
     genre_ids: list[uuid.UUID] | None,
     sort_by: "SortBy",
+    cursor_scope: dict | None = None,
 ) -> GetRecruitingCursorResponse:
+    """
+    cursor_scope(검색어, 필터 hash)는 next_cursor에 함께 서명되어
+    다른 조건의 목록에서 재사용을 막음
+    """
 
-    stmt = select(RecruitingPost)
+    # 카드에 필요한 컬럼만 Core select로 조회 (content 등 ORM 엔티티 로드 없음)
+    stmt = (
+        select(
+            RecruitingPost.id,
+            RecruitingPost.user_id,
+            RecruitingPost.title,
+            RecruitingPost.is_closed,
+            RecruitingPost.created_at,
+            RecruitingPostStats.views_count,
+            RecruitingPostStats.comments_count,
+            RecruitingPostStats.bookmarks_count,
+            RecruitingPost.orientation_id,
+            RecruitingPost.recruitment_type_id,
+            User.nickname.label("author_nickname"),
+            Profile.image_url.label("author_image_url"),
+        )
+        .select_from(RecruitingPost)
+        .join(RecruitingPostStats, RecruitingPostStats.post_id == RecruitingPost.id)
+        .join(User, RecruitingPost.user_id == User.id)
+        .outerjoin(Profile, Profile.user_id == User.id)
+    )
 
     # author
     if author:
         stmt = stmt.where(RecruitingPost.user_id == author)
 
-    # bookmarks: query+=1
-    bookmarked_post_ids = []
-    if current_user_id:  # 로그인한 사용자에 대해서
-        bookmarked_post_id_subquery = select(PostBookmark.bookmarked_post_id).where(
-            PostBookmark.user_id == current_user_id
-        )
-        bookmarked_posts_result = await db.execute(bookmarked_post_id_subquery)
-        bookmarked_post_ids = bookmarked_posts_result.scalars().all()  # list or []
+    # bookmarks: 내가 북마크한 구인글만 (uq_post_bookmark로 중복 없음)
     if bookmarks == "me":
-        stmt = stmt.where(RecruitingPost.id.in_(bookmarked_post_ids))
+        stmt = stmt.join(
+            PostBookmark,
+            and_(
+                PostBookmark.bookmarked_post_id == RecruitingPost.id,
+                PostBookmark.user_id == current_user_id,
+            ),
+        )
 
-    # search_query
+    # search_query: search_document(title + content)의 trigram 인덱스 사용
     if search_query:
         stmt = stmt.where(
-            or_(
-                RecruitingPost.title.ilike(f"%{search_query}%"),
-                RecruitingPost.content.ilike(f"%{search_query}%"),
+            RecruitingPost.search_document.ilike(
+                f"%{escape_like(search_query)}%", escape="\\"
             )
         )
 
@@ -135,148 +272,145 @@ async def get_recruiting_list(
         stmt = stmt.where(RecruitingPost.id.in_(desired_experience_level_subquery))
 
     # sort_by
-    sort_column_map = {
-        SortBy.LATEST: RecruitingPost.created_at,
-        SortBy.VIEWS: RecruitingPost.views_count,
-        SortBy.COMMENTS: RecruitingPost.comments_count,
-        SortBy.BOOKMARK: RecruitingPost.bookmarks_count,
+    # 집계 기준 정렬은 recruiting_post_stats의 (집계 값, created_at, post_id) 인덱스 사용
+    stats_keyset_map = {
+        SortBy.VIEWS: RecruitingPostStats.views_count,
+        SortBy.COMMENTS: RecruitingPostStats.comments_count,
+        SortBy.BOOKMARK: RecruitingPostStats.bookmarks_count,
     }
-    sort_column = sort_column_map[sort_by]
+    sort_column = RecruitingPost.created_at
+    if sort_by in stats_keyset_map:
+        sort_column = stats_keyset_map[sort_by]
+    elif sort_by == SortBy.RELEVANCE and search_query:
+        # 검색어와의 유사도(0~1) 순 정렬
+        sort_column = func.word_similarity(search_query, RecruitingPost.search_document)
+    # 검색어 없이 relevance로 요청하면 최신순
+
+    # 정렬 키: (sort_column, created_at, id) DESC, id로 동점 순서 고정
+    is_sorted_by_created_at = sort_column is RecruitingPost.created_at
+    if is_sorted_by_created_at:
+        keyset_columns = [RecruitingPost.created_at, RecruitingPost.id]
+    elif sort_by in stats_keyset_map:
+        keyset_columns = [
+            sort_column,
+            RecruitingPostStats.created_at,
+            RecruitingPostStats.post_id,
+        ]
+    else:
+        keyset_columns = [sort_column, RecruitingPost.created_at, RecruitingPost.id]
 
-    # cursor 부터 시작: query+=1
+    # cursor에 담긴 정렬 키 이후부터 (추가 쿼리 없음)
     if cursor:
-        cursor_item_stmt = select(sort_column, RecruitingPost.created_at).where(
-            RecruitingPost.id == cursor
-        )
-        cursor_result = await db.execute(cursor_item_stmt)
-        cursor_values = cursor_result.first()
-
-        """
-        부르기 전에 구인글 삭제한 경우 처리 로직 필요
-        """
-        if cursor_values:
-            cursor_sort_value, cursor_created_at = cursor_values
-            stmt = stmt.where(  # DESC
-                tuple_(sort_column, RecruitingPost.created_at)
-                <= (cursor_sort_value, cursor_created_at)
+        cursor_sort_value, cursor_created_at, cursor_id = cursor
+        if is_sorted_by_created_at:
+            cursor_keyset = (cursor_created_at, cursor_id)
+        else:
+            cursor_keyset = (cursor_sort_value, cursor_created_at, cursor_id)
+        # 컬럼 타입으로 바인딩 (timestamp without time zone 비교 유지)
+        stmt = stmt.where(  # DESC
+            tuple_(*keyset_columns)
+            < tuple_(
+                *(
+                    literal(value, column.type)
+                    for column, value in zip(keyset_columns, cursor_keyset)
+                )
             )
-        # next_cursor={} where
-        # offset: 많을 때
-
-    # sort_by로 정렬, 같은 값이면 시간순
-    stmt = stmt.order_by(desc(sort_column), desc(RecruitingPost.created_at))
+        )
 
-    # Eager load related data (N+1 query issue)
-    stmt = stmt.options(
-        selectinload(RecruitingPost.author),
-        selectinload(RecruitingPost.author).selectinload(User.profile),
-        selectinload(RecruitingPost.regions),
-        selectinload(RecruitingPost.genres),
-        selectinload(RecruitingPost.positions),
-        # recruitmenttype
-        # subquery vs join
-        #
-    )
+    stmt = stmt.order_by(*(desc(column) for column in keyset_columns))
+    # 다음 cursor를 만들기 위해 정렬 값도 함께 조회
+    stmt = stmt.add_columns(sort_column.label("sort_value"))
 
     # stmt query 실행: query+=1
     stmt = stmt.limit(limit + 1)  # next_cursor 넣으려고 1개 더
-    result = await db.execute(stmt)
-    result_rows = (
-        result.all()
-    )  # .all() returns a list of <class 'sqlalchemy.engine.row.Row'> objects
-    print("@@@db에서 조회된 개수@@@: ", len(result_rows))
+    result_rows = (await db.execute(stmt)).all()
 
     next_cursor = None
     if len(result_rows) == limit + 1:
-        next_cursor = result_rows[-1][0].__dict__["id"]
         result_rows = result_rows[:-1]
+        last_row = result_rows[-1]
+        next_cursor = encode_cursor(
+            {
+                **(cursor_scope or {}),
+                "sort_by": sort_by.value,
+                "sort_value": None if is_sorted_by_created_at else last_row.sort_value,
+                "created_at": last_row.created_at.isoformat(),
+                "id": str(last_row.id),
+            }
+        )
 
-    # 직렬화
-    posts_response = []
+    page_post_ids = [row.id for row in result_rows]
 
-    """
-    grouping
-    id_list = [post_data["id"] for post_data in result_rows]
-    """
-    # post_obj: (RecruitingPost(),) <class 'sqlalchemy.engine.row.Row'>
-    for post_obj in result_rows:
-        # Row 객체를 딕셔너리로 변환
-        # {'_sa_instance_state': <sqlalchemy.orm.state.InstanceState object at 0x107f23590>
-        post_data = post_obj[0].__dict__
-
-        post_id = post_data["id"]
-
-        author_obj = post_data["author"]  # <class 'app.models.user.User'>
-        post_data["author"] = {
-            "id": author_obj.id,
-            "nickname": author_obj.nickname,
-            "image_url": (author_obj.profile.image_url if author_obj.profile else None),
-        }
-
-        # 딕셔너리에 추가 데이터 삽입
-        post_data["is_owner"] = post_data["user_id"] == current_user_id
-
-        # <class 'sqlmodel.sql._expression_select_cls.SelectOfScalar'>
-        # TypeError: argument of type 'SelectOfScalar' is not iterable
-        post_data["is_bookmarked"] = True if post_id in bookmarked_post_ids else False
-
-        if post_data["orientation_id"]:
-            stmt = select(Orientation).where(
-                Orientation.id == post_data["orientation_id"]
-            )
-            result = await db.execute(stmt)
-            orientation = result.scalars().first()
-            post_data["orientation"] = GetOrientationResponse(
-                id=orientation.id,
-                name=orientation.name,
-            )
-        if post_data["recruitment_type_id"]:
-            stmt = select(RecruitmentType).where(
-                RecruitmentType.id == post_data["recruitment_type_id"]
+    # 현재 페이지의 구인글 중 북마크한 것만 조회: query+=1
+    bookmarked_post_ids = set()
+    if bookmarks == "me":
+        bookmarked_post_ids = set(page_post_ids)
+    elif current_user_id:
+        bookmarked_post_ids = await get_bookmarked_post_ids(
+            db, current_user_id, page_post_ids
+        )
+
+    # 페이지 전체의 포지션/지역/장르를 각각 한 번에 조회: query+=3
+    positions_by_post_id = await get_positions_by_post_ids(db, page_post_ids)
+    regions_by_post_id = await get_master_data_by_post_ids(
+        db,
+        page_post_ids,
+        RecruitingPostRegionLink.post_id,
+        RecruitingPostRegionLink.region_id,
+        Region,
+    )
+    genres_by_post_id = await get_master_data_by_post_ids(
+        db,
+        page_post_ids,
+        RecruitingPostGenreLink.post_id,
+        RecruitingPostGenreLink.genre_id,
+        Genre,
+    )
+
+    # 직렬화: row tuple -> 응답 DTO
+    posts_response = []
+    for row in result_rows:
+        orientation = None
+        if row.orientation_id:
+            orientation = GetOrientationResponse(
+                id=row.orientation_id,
+                name=await master_data_registry.get_name(
+                    db, Orientation, row.orientation_id
+                ),
             )
-            result = await db.execute(stmt)
-            recruitment_type = result.scalars().first()
-            post_data["recruitment_type"] = GetOrientationResponse(
-                id=recruitment_type.id,
-                name=recruitment_type.name,
+        recruitment_type = None
+        if row.recruitment_type_id:
+            recruitment_type = GetRecruitmentTypeResponse(
+                id=row.recruitment_type_id,
+                name=await master_data_registry.get_name(
+                    db, RecruitmentType, row.recruitment_type_id
+                ),
             )
 
-        """
-        Should be re-factored
-        : RecruitingPost, Position, RecruitingPostPositionLink needs to be overhauled
-        """
-        # for position_obj in post_data["positions"]:  # <class 'sqlalchemy.orm.collections.InstrumentedList'>
-        # query+=N
-        positions_stmt = (
-            select(
-                RecruitingPostPositionLink.position_id,
-                Position.name.label("position_name"),
-                RecruitingPostPositionLink.desired_experience_level_id.label(
-                    "experienced_level_id"
+        posts_response.append(
+            GetRecruitingListResponse(
+                id=row.id,
+                author=GetUserProfileResponse(
+                    id=row.user_id,
+                    nickname=row.author_nickname,
+                    image_url=row.author_image_url,
                 ),
-                ExperienceLevel.name.label("experienced_level_name"),
-            )
-            .join(Position, RecruitingPostPositionLink.position_id == Position.id)
-            .join(
-                ExperienceLevel,
-                RecruitingPostPositionLink.desired_experience_level_id
-                == ExperienceLevel.id,
+                title=row.title,
+                is_closed=row.is_closed,
+                created_at=row.created_at,
+                is_owner=row.user_id == current_user_id,
+                is_bookmarked=row.id in bookmarked_post_ids,
+                views_count=row.views_count,
+                comments_count=row.comments_count,
+                bookmarks_count=row.bookmarks_count,
+                orientation=orientation,
+                recruitment_type=recruitment_type,
+                regions=regions_by_post_id[row.id],
+                genres=genres_by_post_id[row.id],
+                positions=positions_by_post_id[row.id],
             )
-            .where(RecruitingPostPositionLink.post_id == post_id)
         )
 
-        # [(UUID('0198a844-cf04-711a-9087-26917d6c6fec'), '키보드', UUID('0198a844-cf07-70e8-960f-35244cea8da4'), '프로'),
-        positions_result = (await db.execute(positions_stmt)).all()
-        positions_response = [
-            GetPositionResponse.model_validate(p) for p in positions_result
-        ]
-        post_data["positions"] = positions_response
-
-        # Pydantic handles nested relationships (author, regions, etc.)
-        # `from_attributes=True` in FROZEN_CONFIG
-        post_dto = GetRecruitingListResponse.model_validate(post_data)
-        posts_response.append(post_dto)
-
     return GetRecruitingCursorResponse(next_cursor=next_cursor, posts=posts_response)
 
 
@@ -300,6 +434,9 @@ async def create_recruiting(
     await db.flush()
     post_id = new_post.id
 
+    # 집계 값은 recruiting_post_stats에 (1:1)
+    db.add(RecruitingPostStats(post_id=post_id, created_at=new_post.created_at))
+
     # None이 아닐 때만
     # Region 관계 재설정
     if create_recruiting_request.region_ids:
@@ -362,9 +499,10 @@ async def get_recruiting_detail(
     current_user_id: uuid.UUID,
 ) -> GetRecruitingDetailResponse:
 
-    post.views_count += 1
-
     post_dict = post.model_dump()
+    post_dict["views_count"] = post.stats.views_count
+    post_dict["comments_count"] = post.stats.comments_count
+    post_dict["bookmarks_count"] = post.stats.bookmarks_count
 
     post_dict["is_owner"] = False
     post_dict["is_bookmarked"] = False
@@ -388,22 +526,18 @@ async def get_recruiting_detail(
     }
 
     if post.orientation_id:
-        stmt = select(Orientation).where(Orientation.id == post.orientation_id)
-        result = await db.execute(stmt)
-        orientation = result.scalars().first()
         post_dict["orientation"] = GetOrientationResponse(
-            id=orientation.id,
-            name=orientation.name,
+            id=post.orientation_id,
+            name=await master_data_registry.get_name(
+                db, Orientation, post.orientation_id
+            ),
         )
     if post.recruitment_type_id:
-        stmt = select(RecruitmentType).where(
-            RecruitmentType.id == post.recruitment_type_id
-        )
-        result = await db.execute(stmt)
-        recruitment_type = result.scalars().first()
-        post_dict["recruitment_type"] = GetOrientationResponse(
-            id=recruitment_type.id,
-            name=recruitment_type.name,
+        post_dict["recruitment_type"] = GetRecruitmentTypeResponse(
+            id=post.recruitment_type_id,
+            name=await master_data_registry.get_name(
+                db, RecruitmentType, post.recruitment_type_id
+            ),
         )
     if post.regions:
         post_dict["regions"] = [
@@ -414,33 +548,10 @@ async def get_recruiting_detail(
             GetGenreResponse.model_validate(genre) for genre in post.genres
         ]
 
-    if post.positions:
-        positions_stmt = (
-            select(
-                RecruitingPostPositionLink.position_id,
-                Position.name.label("position_name"),
-                RecruitingPostPositionLink.desired_experience_level_id.label(
-                    "experienced_level_id"
-                ),
-                ExperienceLevel.name.label("experienced_level_name"),
-            )
-            .join(Position, RecruitingPostPositionLink.position_id == Position.id)
-            .join(
-                ExperienceLevel,
-                RecruitingPostPositionLink.desired_experience_level_id
-                == ExperienceLevel.id,
-            )
-            .where(RecruitingPostPositionLink.post_id == post.id)
-        )
-
-        # [(UUID('0198a844-cf04-711a-9087-26917d6c6fec'), '키보드', UUID('0198a844-cf07-70e8-960f-35244cea8da4'), '프로'),
-        positions_result = (await db.execute(positions_stmt)).all()
-        positions_response = [
-            GetPositionResponse.model_validate(p) for p in positions_result
-        ]
-        post_dict["positions"] = positions_response
+    positions_by_post_id = await get_positions_by_post_ids(db, [post.id])
+    if positions_by_post_id[post.id]:
+        post_dict["positions"] = positions_by_post_id[post.id]
 
-    await db.commit()
     return GetRecruitingDetailResponse.model_validate(post_dict)
 
 
@@ -543,13 +654,29 @@ async def update_recruiting_is_closed_status(
 
 # FR-017: 구인글 삭제
 async def delete_recruiting(db: AsyncSession, post: RecruitingPost) -> None:
-    # async with db.begin():  # sqlalchemy.exc.InvalidRequestError: A transaction is already begun on this Session.
-
-    # SQLModel/SQLAlchemy: 관련 Link 자동 로드 및 삭제도 해주네
-    # for region in post.regions:
-    #     await db.delete(region)
-
-    await db.delete(post)
+    # 댓글/북마크/연결 테이블을 ORM cascade로 하나씩 로드해서 지우지 않고
+    # 구인글 기준으로 한 번에 삭제
+    post_id = post.id
+    await db.execute(
+        delete(PostBookmark).where(PostBookmark.bookmarked_post_id == post_id)
+    )
+    await db.execute(delete(Comment).where(Comment.post_id == post_id))
+    await db.execute(
+        delete(RecruitingPostRegionLink).where(
+            RecruitingPostRegionLink.post_id == post_id
+        )
+    )
+    await db.execute(
+        delete(RecruitingPostGenreLink).where(
+            RecruitingPostGenreLink.post_id == post_id
+        )
+    )
+    await db.execute(
+        delete(RecruitingPostPositionLink).where(
+            RecruitingPostPositionLink.post_id == post_id
+        )
+    )
+    await db.execute(delete(RecruitingPost).where(RecruitingPost.id == post_id))
     await db.commit()
 
 
@@ -560,11 +687,16 @@ async def create_comment(
     current_user_id: uuid.UUID,
     post: RecruitingPost,
     create_comment_request: CreateCommentRequest,
+    parent_path: str | None = None,
 ) -> None:
+    # path(NOT NULL)에 id가 들어가므로 id(uuid_generate_v7)를 먼저 받아서 한 번에 INSERT
+    comment_id = await db.scalar(select(func.uuid_generate_v7()))
     new_comment = Comment(
+        id=comment_id,
         post_id=post.id,
         user_id=current_user_id,
         content=create_comment_request.content,
+        path=build_comment_path(parent_path, comment_id),
         parent_comment_id=(
             create_comment_request.parent_comment_id
             if create_comment_request.parent_comment_id
@@ -572,8 +704,9 @@ async def create_comment(
         ),
     )
 
-    # 해당 구인글의 comments_count 집계
-    post.comments_count += 1
     db.add(new_comment)
 
+    # 해당 구인글의 comments_count 집계 (UPDATE ... RETURNING)
+    await change_post_comments_count(db, post.id, 1)
+
     await db.commit()
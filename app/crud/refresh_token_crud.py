@@ -0,0 +1,96 @@
+# app/crud/refresh_token_crud.py
+import uuid
+from datetime import datetime
+
+from sqlalchemy import delete, false, func, insert, literal, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import RefreshToken
+from app.models.base_model import KST
+
+refresh_tokens_table = RefreshToken.__table__
+
+
+def is_active_refresh_token():
+    """폐기되지 않았고 만료되지 않은 토큰"""
+    return (
+        refresh_tokens_table.c.is_revoked.is_(False),
+        refresh_tokens_table.c.expired_at > func.now(),
+    )
+
+
+def add_refresh_token(
+    db: AsyncSession, user_id: uuid.UUID, jti: uuid.UUID, expired_at: datetime
+) -> None:
+    db.add(RefreshToken(jti=jti, user_id=user_id, expired_at=expired_at))
+
+
+async def rotate_refresh_token(
+    db: AsyncSession, jti: uuid.UUID, new_jti: uuid.UUID, new_expired_at: datetime
+) -> uuid.UUID | None:
+    """
+    기존 토큰 폐기 + 새 토큰 저장을 하나의 문장으로 처리하고 user_id 반환
+    WITH revoked AS (UPDATE ... RETURNING user_id) INSERT ... SELECT FROM revoked
+    동시에 같은 토큰으로 갱신하면 한 요청만 성공 (나머지는 None)
+    """
+    revoked = (
+        update(refresh_tokens_table)
+        .where(refresh_tokens_table.c.jti == jti, *is_active_refresh_token())
+        .values(is_revoked=True)
+        .returning(refresh_tokens_table.c.user_id)
+        .cte("revoked")
+    )
+    stmt = (
+        insert(refresh_tokens_table)
+        .from_select(
+            ["jti", "user_id", "expired_at", "is_revoked", "created_at"],
+            select(
+                literal(new_jti, refresh_tokens_table.c.jti.type),
+                revoked.c.user_id,
+                literal(new_expired_at, refresh_tokens_table.c.expired_at.type),
+                false(),
+                literal(datetime.now(KST), refresh_tokens_table.c.created_at.type),
+            ),
+        )
+        .returning(refresh_tokens_table.c.user_id)
+    )
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def revoke_refresh_token(db: AsyncSession, jti: uuid.UUID) -> bool:
+    """토큰을 폐기하고, 이번 호출로 폐기되었는지 여부 반환"""
+    stmt = (
+        update(refresh_tokens_table)
+        .where(
+            refresh_tokens_table.c.jti == jti,
+            refresh_tokens_table.c.is_revoked.is_(False),
+        )
+        .values(is_revoked=True)
+    )
+    result = await db.execute(stmt)
+    return result.rowcount > 0
+
+
+async def purge_refresh_tokens(db: AsyncSession, batch_size: int) -> int:
+    """
+    만료되었거나 폐기된 토큰을 최대 batch_size개 삭제하고 삭제한 개수 반환
+    폐기된 토큰은 행이 없어도 갱신이 거절되므로 바로 삭제해도 됨
+    """
+    purge_ids = (
+        select(refresh_tokens_table.c.id)
+        .where(
+            or_(
+                refresh_tokens_table.c.expired_at <= func.now(),
+                # 부분 인덱스(WHERE is_revoked)와 같은 형태로 비교
+                refresh_tokens_table.c.is_revoked,
+            )
+        )
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = delete(refresh_tokens_table).where(
+        refresh_tokens_table.c.id.in_(purge_ids.scalar_subquery())
+    )
+    result = await db.execute(stmt)
+    return result.rowcount
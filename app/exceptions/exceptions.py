@@ -68,6 +68,58 @@ class UserNotCommentOwner(Exception):
         super().__init__(self.message)
 
 
+class InvalidCursor(Exception):
+    """
+    cursor 형식이 잘못되었거나 위조되었을 때
+    """
+
+    def __init__(self, message: str = "유효하지 않은 cursor 입니다."):
+        self.message = message
+        super().__init__(self.message)
+
+
+class InvalidImageUpload(Exception):
+    """
+    업로드할 이미지의 형식이나 key가 올바르지 않을 때
+    """
+
+    def __init__(self, message: str = "업로드할 수 없는 이미지입니다."):
+        self.message = message
+        super().__init__(self.message)
+
+
+class ImageNotUploaded(Exception):
+    """
+    presigned 업로드 확인 시 저장소에 이미지가 없을 때
+    """
+
+    def __init__(self, message: str = "업로드된 이미지를 찾을 수 없습니다."):
+        self.message = message
+        super().__init__(self.message)
+
+
+class PresignedUploadNotSupported(Exception):
+    """
+    presigned 업로드를 지원하지 않는 저장소(로컬 디스크)일 때
+    """
+
+    def __init__(
+        self, message: str = "현재 저장소는 presigned 업로드를 지원하지 않습니다."
+    ):
+        self.message = message
+        super().__init__(self.message)
+
+
+class StorageError(Exception):
+    """
+    이미지 저장소(S3, 로컬 디스크) 읽기/쓰기에 실패했을 때
+    """
+
+    def __init__(self, message: str = "FILE_STORAGE_ERROR"):
+        self.message = message
+        super().__init__(self.message)
+
+
 ### 북마크
 # 이미 북마크가 되어있을 때
 class PostAlreadyBookmarked(Exception):
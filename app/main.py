@@ -1,6 +1,11 @@
 # app/main.py
+import logging
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.staticfiles import StaticFiles
 
 from app.api.v1.comment_router import comment_router
 from app.api.v1.endpoints.auth import router as auth_router
@@ -9,8 +14,47 @@ from app.api.v1.endpoints.user import router as user_router
 from app.api.v1.image_upload_router import image_upload_router
 from app.api.v1.master_data_router import master_data_router
 from app.api.v1.recruiting_router import recruiting_router
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, get_pool_stats
+from app.core.master_data import master_data_registry
+from app.core.security import password_hasher
+from app.core.storage import storage
+from app.services.image_upload_service import image_variant_pipeline
+from app.services.refresh_token_purge_service import refresh_token_purge_service
+from app.services.view_count_service import view_count_service
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 마스터 데이터를 메모리에 미리 로드 (실패하면 첫 조회 시 로드)
+    try:
+        async with AsyncSessionLocal() as session:
+            await master_data_registry.load(session)
+    except Exception as e:
+        logger.error(f"Failed to load master data on startup: {e}", exc_info=True)
+
+    view_count_service.start()
+    refresh_token_purge_service.start()
+    image_variant_pipeline.start()
+
+    yield
 
-app = FastAPI(title="Akabi Project API", version="0.1.0", redirect_slashes=False)
+    # 종료 전에 남은 조회수 반영
+    await view_count_service.stop()
+    await refresh_token_purge_service.stop()
+    await image_variant_pipeline.stop()
+    password_hasher.shutdown()
+    storage.shutdown()
+
+
+app = FastAPI(
+    title="Akabi Project API",
+    version="0.1.0",
+    redirect_slashes=False,
+    lifespan=lifespan,
+)
 
 # CORS 설정
 origins = [
@@ -33,6 +77,12 @@ def read_root():
     return {"status": "ok", "message": "Welcome to the Akhabi API!"}
 
 
+@app.get("/status/pools")
+def read_pool_stats():
+    """현재 worker의 DB 커넥션 풀 / 비밀번호 해싱 스레드 풀 상태"""
+    return {"db": get_pool_stats(), "password_hasher": password_hasher.get_stats()}
+
+
 # 앞으로 이곳에 각 기능별 라우터를 추가
 # 예: app.include_router(user_router, prefix="/api/v1/users")
 
@@ -51,3 +101,11 @@ app.include_router(
 app.include_router(
     master_data_router, prefix="/api/v1/common/master-data", tags=["Master Data"]
 )
+
+# 로컬 저장소 이미지 (운영에서는 nginx가 서빙)
+if settings.STORAGE_BACKEND == "local" and settings.IMAGE_SERVE_FROM_APP:
+    app.mount(
+        urlparse(settings.IMAGE_BASE_URL).path.rstrip("/"),
+        StaticFiles(directory=storage.root_dir, check_dir=False),
+        name="images",
+    )
@@ -16,6 +16,7 @@ from .recruiting_model import (
     RecruitingPostGenreLink,
     RecruitingPostPositionLink,
     RecruitingPostRegionLink,
+    RecruitingPostStats,
 )
 from .user_model import (
     Profile,
@@ -47,6 +48,7 @@ __all__ = [
     "RecruitingPostRegionLink",
     "RecruitingPostGenreLink",
     "RecruitingPostPositionLink",
+    "RecruitingPostStats",
     "UserBookmark",
     "PostBookmark",
 ]
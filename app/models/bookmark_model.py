@@ -2,7 +2,7 @@
 import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, Relationship
 
 from .base_model import BaseModel
@@ -19,6 +19,7 @@ class UserBookmark(BaseModel, table=True):
     __tablename__ = "user_bookmarks"
     __table_args__ = (
         UniqueConstraint("user_id", "bookmarked_user_id", name="uq_user_bookmark"),
+        Index("ix_user_bookmarks_bookmarked_user_id", "bookmarked_user_id"),
     )
 
     user_id: uuid.UUID = Field(foreign_key="users.id")
@@ -38,6 +39,8 @@ class PostBookmark(BaseModel, table=True):
     __tablename__ = "post_bookmarks"
     __table_args__ = (
         UniqueConstraint("user_id", "bookmarked_post_id", name="uq_post_bookmark"),
+        # 구인글 기준 조회/삭제(cascade)
+        Index("ix_post_bookmarks_bookmarked_post_id", "bookmarked_post_id"),
     )
 
     user_id: uuid.UUID = Field(foreign_key="users.id")
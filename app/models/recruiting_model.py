@@ -1,7 +1,9 @@
 # app/models/recruiting.py
 import uuid
+from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
+from sqlalchemy import Column, Computed, Index, Text, text
 from sqlmodel import Field, Relationship, SQLModel
 
 from .base_model import BaseModel
@@ -14,18 +16,38 @@ if TYPE_CHECKING:
 
 class RecruitingPostRegionLink(SQLModel, table=True):
     __tablename__ = "recruiting_post_regions"
+    # region_ids 필터(regions.any)에서 역방향 조회
+    __table_args__ = (
+        Index("ix_recruiting_post_regions_region_id_post_id", "region_id", "post_id"),
+    )
     post_id: uuid.UUID = Field(foreign_key="recruiting_posts.id", primary_key=True)
     region_id: uuid.UUID = Field(foreign_key="regions.id", primary_key=True)
 
 
 class RecruitingPostGenreLink(SQLModel, table=True):
     __tablename__ = "recruiting_post_genres"
+    __table_args__ = (
+        Index("ix_recruiting_post_genres_genre_id_post_id", "genre_id", "post_id"),
+    )
     post_id: uuid.UUID = Field(foreign_key="recruiting_posts.id", primary_key=True)
     genre_id: uuid.UUID = Field(foreign_key="genres.id", primary_key=True)
 
 
 class RecruitingPostPositionLink(SQLModel, table=True):
     __tablename__ = "recruiting_post_positions"
+    __table_args__ = (
+        Index(
+            "ix_recruiting_post_positions_position_id_post_id",
+            "position_id",
+            "post_id",
+        ),
+        # experienced_level 필터
+        Index(
+            "ix_recruiting_post_positions_experience_level_id_post_id",
+            "desired_experience_level_id",
+            "post_id",
+        ),
+    )
     post_id: uuid.UUID = Field(foreign_key="recruiting_posts.id", primary_key=True)
     position_id: uuid.UUID = Field(foreign_key="positions.id", primary_key=True)
     desired_experience_level_id: uuid.UUID = Field(foreign_key="experience_levels.id")
@@ -33,6 +55,23 @@ class RecruitingPostPositionLink(SQLModel, table=True):
 
 class RecruitingPost(BaseModel, table=True):
     __tablename__ = "recruiting_posts"
+    __table_args__ = (
+        # 검색어 부분 일치(ILIKE '%q%') 및 유사도 정렬용 trigram 인덱스
+        Index(
+            "ix_recruiting_posts_search_document_trgm",
+            "search_document",
+            postgresql_using="gin",
+            postgresql_ops={"search_document": "gin_trgm_ops"},
+        ),
+        # 목록 정렬(SortBy)별 keyset 인덱스: DESC 정렬은 역방향 index scan으로 처리
+        # (집계 기준 정렬은 recruiting_post_stats 인덱스 사용)
+        Index("ix_recruiting_posts_created_at_id", "created_at", "id"),
+        # author 필터
+        Index(
+            "ix_recruiting_posts_user_id_created_at_id", "user_id", "created_at", "id"
+        ),
+        Index("ix_recruiting_posts_orientation_id", "orientation_id"),
+    )
 
     user_id: uuid.UUID = Field(foreign_key="users.id")
     title: str = Field(max_length=255)
@@ -45,9 +84,6 @@ class RecruitingPost(BaseModel, table=True):
     application_method: Optional[str] = Field(default=None)
     practice_frequency_time: Optional[str] = Field(max_length=100, default=None)
     other_conditions: Optional[str] = Field(default=None)
-    views_count: int = Field(default=0)
-    comments_count: int = Field(default=0)
-    bookmarks_count: int = Field(default=0)
     is_closed: bool = Field(default=False)
     orientation_id: Optional[uuid.UUID] = Field(
         default=None, foreign_key="orientations.id"
@@ -55,8 +91,18 @@ class RecruitingPost(BaseModel, table=True):
     recruitment_type_id: Optional[uuid.UUID] = Field(
         default=None, foreign_key="recruitment_types.id"
     )
+    # 검색용 문서: title/content가 바뀌면 DB가 자동으로 다시 계산
+    search_document: Optional[str] = Field(
+        default=None,
+        sa_column=Column(
+            Text, Computed("title || ' ' || content", persisted=True), nullable=True
+        ),
+    )
 
     author: "User" = Relationship(back_populates="recruiting_posts")
+    stats: Optional["RecruitingPostStats"] = Relationship(
+        sa_relationship_kwargs={"uselist": False, "passive_deletes": True}
+    )
 
     comments: List["Comment"] = Relationship(
         back_populates="post",
@@ -78,13 +124,73 @@ class RecruitingPost(BaseModel, table=True):
     )
 
 
+class RecruitingPostStats(SQLModel, table=True):
+    """
+    구인글 집계 값(1:1)
+    자주 바뀌는 카운터를 좁은 행에 따로 두어 recruiting_posts(긴 content) 행을
+    다시 쓰지 않도록 함 (fillfactor는 migration에서 설정)
+    """
+
+    __tablename__ = "recruiting_post_stats"
+    __table_args__ = (
+        # 목록 정렬(SortBy)별 keyset 인덱스: (집계 값, created_at, post_id)
+        Index(
+            "ix_recruiting_post_stats_views_count_created_at_post_id",
+            "views_count",
+            "created_at",
+            "post_id",
+        ),
+        Index(
+            "ix_recruiting_post_stats_comments_count_created_at_post_id",
+            "comments_count",
+            "created_at",
+            "post_id",
+        ),
+        Index(
+            "ix_recruiting_post_stats_bookmarks_count_created_at_post_id",
+            "bookmarks_count",
+            "created_at",
+            "post_id",
+        ),
+    )
+
+    post_id: uuid.UUID = Field(
+        foreign_key="recruiting_posts.id", primary_key=True, ondelete="CASCADE"
+    )
+    # keyset 정렬용: 구인글 created_at 복사본 (변경되지 않음)
+    created_at: datetime = Field(nullable=False)
+    views_count: int = Field(default=0)
+    comments_count: int = Field(default=0)
+    bookmarks_count: int = Field(default=0)
+
+
 class Comment(BaseModel, table=True):
     __tablename__ = "comments"
+    __table_args__ = (
+        # 구인글의 최상위 댓글 목록
+        Index(
+            "ix_comments_post_id_created_at_id_top_level",
+            "post_id",
+            "created_at",
+            "id",
+            postgresql_where=text("parent_comment_id IS NULL"),
+        ),
+        # 작성자의 댓글 목록
+        Index("ix_comments_user_id_created_at_id", "user_id", "created_at", "id"),
+        # 대댓글 미리보기/목록 (부모별 최신순)
+        Index(
+            "ix_comments_parent_comment_id_created_at_id",
+            "parent_comment_id",
+            "created_at",
+            "id",
+        ),
+    )
 
     post_id: uuid.UUID = Field(foreign_key="recruiting_posts.id")
     user_id: uuid.UUID = Field(foreign_key="users.id")
     content: str
-    path: Optional[str] = Field(max_length=255, default=None, index=True)
+    # materialized path (조상부터 자신까지 id.hex), 작성 시 INSERT와 함께 저장
+    path: str = Field(max_length=255, index=True)
     is_deleted: bool = Field(default=False)
     parent_comment_id: Optional[uuid.UUID] = Field(
         default=None, foreign_key="comments.id"
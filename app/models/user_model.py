@@ -3,7 +3,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index, text
 from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -125,6 +125,15 @@ class SocialAccount(BaseModel, table=True):
 
 class RefreshToken(BaseModel, table=True):
     __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # 만료/폐기된 토큰 batch 정리용
+        Index("ix_refresh_tokens_expired_at", "expired_at"),
+        Index(
+            "ix_refresh_tokens_revoked_id",
+            "id",
+            postgresql_where=text("is_revoked"),
+        ),
+    )
 
     user_id: uuid.UUID = Field(foreign_key="users.id")
     jti: uuid.UUID = Field(unique=True)
@@ -51,11 +51,43 @@ class GetCommentListResponse(BaseModel):
     is_owner: bool
     author: GetUserProfileResponse
 
+    # 최신 대댓글 미리보기 (전체 개수는 children_count)
     children: list["GetChildCommentResponse"] | None = None
+    children_count: int = 0
+    children_next_cursor: str | None = None  # 대댓글 목록 조회에 사용할 cursor
 
 
 class GetCommentCursorResponse(BaseModel):
     model_config = FROZEN_CONFIG
 
-    next_cursor: uuid.UUID | None = None
+    next_cursor: str | None = None  # 서명된 불투명 cursor
     comments: list[GetCommentListResponse] | None = None
+
+
+# 대댓글 목록 조회
+class GetChildCommentCursorResponse(BaseModel):
+    model_config = FROZEN_CONFIG
+
+    next_cursor: str | None = None  # 서명된 불투명 cursor
+    children: list[GetChildCommentResponse] | None = None
+
+
+# 댓글 스레드(하위 트리) 조회
+class GetCommentThreadResponse(BaseModel):
+    model_config = FROZEN_CONFIG
+
+    id: uuid.UUID
+    parent_comment_id: uuid.UUID | None = None
+    content: str
+    created_at: datetime
+    depth: int  # 최상위 댓글이 1
+
+    is_owner: bool
+    author: GetUserProfileResponse
+
+
+class GetCommentThreadCursorResponse(BaseModel):
+    model_config = FROZEN_CONFIG
+
+    next_cursor: str | None = None  # 서명된 불투명 cursor
+    comments: list[GetCommentThreadResponse] | None = None
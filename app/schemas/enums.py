@@ -10,3 +10,12 @@ class SortBy(str, Enum):
     COMMENTS = "comments"
     VIEWS = "views"
     BOOKMARK = "bookmark"
+    RELEVANCE = "relevance"  # search_query와 함께 사용
+
+
+class RecruitingLoadProfile(str, Enum):
+    """get_recruiting_by_id에서 함께 로드할 범위"""
+
+    EXISTENCE = "existence"  # 존재 여부(id)만 확인
+    OWNERSHIP = "ownership"  # 작성자 확인(user_id) 후 수정/삭제
+    DETAIL = "detail"  # 상세 조회: 작성자 프로필, 지역, 장르
@@ -14,5 +14,24 @@ class ImageUploadResponse(BaseModel):
 
     image_url: str
 
+
+class ImagePresignRequest(BaseModel):
+    filename: str
+    content_type: str
+
+
+class ImagePresignResponse(BaseModel):
+    model_config = FROZEN_CONFIG
+
+    url: str  # multipart/form-data로 POST할 주소
+    fields: dict[str, str]  # file보다 먼저 form에 그대로 넣어야 하는 값
+    key: str  # 업로드 후 confirm 요청에 사용
+    max_size: int
+    expires_in: int
+
+
+class ImageConfirmRequest(BaseModel):
+    key: str
+
     # class Config:
     #     from_attributes = True  # "orm_mode = True" has been deprecated
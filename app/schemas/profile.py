@@ -2,8 +2,10 @@
 import uuid
 from typing import TYPE_CHECKING, List, Optional
 
+from pydantic import computed_field
 from sqlmodel import SQLModel
 
+from app.core.image_variants import get_image_variant_url
 from app.models.user_model import ProfilePositionLink
 
 # from app.schemas.common import ExperienceLevelRead, PositionRead
@@ -49,6 +51,12 @@ class ProfileListRead(SQLModel):
     positions: Optional[List[PositionWithExperienceRead]] = []
     genres: Optional[List[GenreRead]] = []
 
+    @computed_field
+    @property
+    def image_thumbnail_url(self) -> Optional[str]:
+        """160px 정사각형 WebP (업로드한 이미지가 아니면 None)"""
+        return get_image_variant_url(self.image_url, "thumb")
+
 
 class ProfileListResponse(SQLModel):
     next_cursor: str | None = None  # 다음 페이지가 없으면 None
@@ -1,8 +1,9 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, computed_field
 
+from app.core.image_variants import get_image_variant_url
 from app.schemas.frozen_config import FROZEN_CONFIG
 
 ##### 공통 시작 #####
@@ -16,6 +17,12 @@ class GetUserProfileResponse(BaseModel):
 
     image_url: str | None = None  # from Profile
 
+    @computed_field
+    @property
+    def image_thumbnail_url(self) -> str | None:
+        """160px 정사각형 WebP (업로드한 이미지가 아니면 None)"""
+        return get_image_variant_url(self.image_url, "thumb")
+
 
 class GetOrientationResponse(BaseModel):
     model_config = FROZEN_CONFIG
@@ -93,7 +100,7 @@ class GetRecruitingListResponse(BaseModel):
 class GetRecruitingCursorResponse(BaseModel):
     model_config = FROZEN_CONFIG
 
-    next_cursor: uuid.UUID | None = None
+    next_cursor: str | None = None  # 서명된 불투명 cursor
     posts: list[GetRecruitingListResponse] | None = None
 
 
@@ -135,6 +142,12 @@ class GetRecruitingDetailResponse(BaseModel):
     genres: list[GetGenreResponse] | None = None
     positions: list[GetPositionResponse] | None = None
 
+    @computed_field
+    @property
+    def image_medium_url(self) -> str | None:
+        """긴 변 640px WebP (업로드한 이미지가 아니면 None)"""
+        return get_image_variant_url(self.image_url, "medium")
+
 
 # FR-014: 구인글 작성, FR-015: 구인글 수정
 class RecruitingDetailRequest(BaseModel):
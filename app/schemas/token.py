@@ -1,8 +1,13 @@
 # app/schemas/token.py
+import uuid
+from datetime import datetime
 from typing import Optional
 
+from pydantic import BaseModel
 from sqlmodel import SQLModel
 
+from app.schemas.frozen_config import FROZEN_CONFIG
+
 
 class Token(SQLModel):
     access_token: str
@@ -12,3 +17,12 @@ class Token(SQLModel):
 
 class TokenPayload(SQLModel):
     sub: Optional[str] = None  # sub는 토큰의 주체(subject) - (user_id)
+
+
+class Principal(BaseModel):
+    """검증된 access token에서 바로 만든 현재 사용자 정보 (DB 조회 없음)"""
+
+    model_config = FROZEN_CONFIG
+
+    id: uuid.UUID  # sub
+    expires_at: datetime  # exp
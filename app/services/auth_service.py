@@ -6,10 +6,15 @@ from typing import Any, Union
 from jose import jwt
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
 
 from app.core.config import settings
-from app.models.user_model import RefreshToken, User
+from app.core.revoked_tokens import revoked_token_index
+from app.crud.refresh_token_crud import (
+    add_refresh_token,
+    revoke_refresh_token,
+    rotate_refresh_token,
+)
+from app.models.user_model import User
 from app.schemas.token import Token, TokenPayload
 
 
@@ -23,6 +28,11 @@ class AuthService:
             to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM
         )
 
+    def get_refresh_token_expired_at(self) -> datetime:
+        return datetime.now(timezone.utc) + timedelta(
+            days=settings.REFRESH_TOKEN_EXPIRE_DAYS
+        )
+
     async def create_tokens_and_save_refresh_token(
         self, db: AsyncSession, user: User
     ) -> Token:
@@ -39,14 +49,10 @@ class AuthService:
         # 3. Refresh Token 생성 (sub = jti)
         refresh_token_str = self.create_refresh_token(subject=jti)
 
-        # 4. DB에 저장할 RefreshToken 객체 생성
-        db_refresh_token = RefreshToken(
-            jti=jti,
-            user_id=user.id,
-            expired_at=datetime.now(timezone.utc)
-            + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        # 4. DB에 저장
+        add_refresh_token(
+            db, user_id=user.id, jti=jti, expired_at=self.get_refresh_token_expired_at()
         )
-        db.add(db_refresh_token)
         await db.commit()
 
         return Token(access_token=access_token, refresh_token=refresh_token_str)
@@ -72,48 +78,65 @@ class AuthService:
         refresh_token = self.create_refresh_token(subject=user.id)
         return Token(access_token=access_token, refresh_token=refresh_token)
 
-    async def get_user_from_refresh_token(
-        self, db: AsyncSession, token: str
-    ) -> User | None:
-        """리프레시 토큰을 검증하고 사용자 객체를 반환합니다."""
+    def decode_refresh_token(self, token: str) -> tuple[uuid.UUID, float] | None:
+        """리프레시 토큰을 검증하고 (jti, exp) 반환"""
         try:
             payload = jwt.decode(
                 token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
             )
             token_data = TokenPayload(**payload)
-        except (jwt.JWTError, ValidationError):
+            return uuid.UUID(token_data.sub), float(payload["exp"])
+        except (jwt.JWTError, ValidationError, KeyError, TypeError, ValueError):
+            return None
+
+    async def rotate_tokens(self, db: AsyncSession, token: str) -> Token | None:
+        """
+        리프레시 토큰을 폐기하고 새 Access/Refresh Token 발급
+        폐기된(이미 사용한) 토큰이면 None
+        """
+        decoded = self.decode_refresh_token(token)
+        if decoded is None:
             return None
 
-        statement = select(RefreshToken).where(RefreshToken.jti == token_data.sub)
-        result = await db.execute(statement)
-        refresh_token_obj = result.scalar_one_or_none()
+        jti, expires_at = decoded
+        if revoked_token_index.contains(jti):
+            return None
 
-        if not refresh_token_obj or refresh_token_obj.is_revoked:
+        new_jti = uuid.uuid4()
+        user_id = await rotate_refresh_token(
+            db,
+            jti=jti,
+            new_jti=new_jti,
+            new_expired_at=self.get_refresh_token_expired_at(),
+        )
+        if user_id is None:
+            # 폐기/만료/없는 토큰: 다음 요청부터는 DB 조회 없이 거절
+            await db.rollback()
+            revoked_token_index.add(jti, expires_at)
             return None
 
-        user_statement = select(User).where(User.id == refresh_token_obj.user_id)
-        user_result = await db.execute(user_statement)
-        return user_result.scalar_one_or_none()
+        await db.commit()
+        revoked_token_index.add(jti, expires_at)
+
+        return Token(
+            access_token=self.create_access_token(subject=user_id),
+            refresh_token=self.create_refresh_token(subject=new_jti),
+        )
 
     async def revoke_refresh_token(self, db: AsyncSession, token: str):
         """리프레시 토큰을 DB에서 찾아 is_revoked를 True로 설정"""
-        try:
-            payload = jwt.decode(
-                token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-            )
-            token_data = TokenPayload(**payload)
-        except (jwt.JWTError, ValidationError):
+        decoded = self.decode_refresh_token(token)
+        if decoded is None:
             # 유효하지 않은 토큰은 이미 무효화된 것과 같으므로 그냥 넘어감
             return
 
-        statement = select(RefreshToken).where(RefreshToken.jti == token_data.sub)
-        result = await db.execute(statement)
-        refresh_token_obj = result.scalar_one_or_none()
+        jti, expires_at = decoded
+        if revoked_token_index.contains(jti):
+            return
 
-        if refresh_token_obj:
-            refresh_token_obj.is_revoked = True
-            db.add(refresh_token_obj)
-            await db.commit()
+        await revoke_refresh_token(db, jti)
+        await db.commit()
+        revoked_token_index.add(jti, expires_at)
 
 
 auth_service = AuthService()
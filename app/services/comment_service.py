@@ -1,16 +1,23 @@
 import uuid
+from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cursor import decode_cursor
 from app.crud.comment_crud import (
     delete_comment,
+    get_author_comment_list,
+    get_comment_brief,
     get_comment_by_id,
-    get_comment_list,
+    get_comment_thread,
+    get_post_comment_list,
+    get_reply_list,
     update_comment_content,
 )
 from app.crud.recruiting_crud import get_recruiting_by_id, get_user_by_id
 from app.exceptions.exceptions import (
     CommentNotFound,
+    InvalidCursor,
     NotFirstParentComment,
     PostNotFound,
     UserNotCommentOwner,
@@ -18,39 +25,122 @@ from app.exceptions.exceptions import (
 )
 from app.schemas.comment_schema import (
     CreateCommentRequest,
+    GetChildCommentCursorResponse,
     GetCommentCursorResponse,
+    GetCommentThreadCursorResponse,
 )
 
 
+def parse_comment_cursor(
+    cursor: str, cursor_scope: dict | None = None
+) -> tuple[datetime, uuid.UUID]:
+    """
+    댓글/대댓글 목록 cursor를 (created_at, id)로 복원
+    cursor_scope(post_id / author / parent_comment_id)가 발급 시점과 다르면 InvalidCursor
+    """
+    payload = decode_cursor(cursor)
+    for key, value in (cursor_scope or {}).items():
+        if payload.get(key) != value:
+            raise InvalidCursor()
+
+    try:
+        return datetime.fromisoformat(payload["created_at"]), uuid.UUID(payload["id"])
+    except (KeyError, TypeError, ValueError):
+        raise InvalidCursor()
+
+
 # FR-019: 댓글 목록 조회
 async def service_get_comment_list(
     db: AsyncSession,
-    post_id: uuid.UUID,
-    current_user_id: uuid.UUID,
-    author: uuid.UUID,
+    post_id: uuid.UUID | None,
+    current_user_id: uuid.UUID | None,
+    author: uuid.UUID | None,
     limit: int,
-    cursor: uuid.UUID,
+    cursor: str | None,
 ) -> GetCommentCursorResponse:
 
+    # cursor는 서명된 (created_at, id)라서 DB 조회 없이 검증
     if post_id:
         post = await get_recruiting_by_id(db, post_id)
         if not post:
             raise PostNotFound()
-    if author:
-        user = await get_user_by_id(db, author)
-        if not user:
-            raise UserNotFound()
 
+        return await get_post_comment_list(
+            db,
+            post_id,
+            current_user_id,
+            limit,
+            (
+                parse_comment_cursor(cursor, {"post_id": str(post_id)})
+                if cursor
+                else None
+            ),
+        )
+
+    user = await get_user_by_id(db, author)
+    if not user:
+        raise UserNotFound()
+
+    return await get_author_comment_list(
+        db,
+        author,
+        current_user_id,
+        limit,
+        parse_comment_cursor(cursor, {"author": str(author)}) if cursor else None,
+    )
+
+
+# 대댓글 목록 조회
+async def service_get_reply_list(
+    db: AsyncSession,
+    parent_comment_id: uuid.UUID,
+    current_user_id: uuid.UUID | None,
+    limit: int,
+    cursor: str | None,
+) -> GetChildCommentCursorResponse:
+
+    parent_comment = await get_comment_brief(db, parent_comment_id)
+    if not parent_comment:
+        raise CommentNotFound()
+    elif parent_comment.parent_comment_id:  # 대댓글에는 대댓글이 없음
+        raise NotFirstParentComment()
+
+    return await get_reply_list(
+        db,
+        parent_comment_id,
+        current_user_id,
+        limit,
+        (
+            parse_comment_cursor(cursor, {"parent_comment_id": str(parent_comment_id)})
+            if cursor
+            else None
+        ),
+    )
+
+
+# 댓글 스레드(하위 트리) 조회
+async def service_get_comment_thread(
+    db: AsyncSession,
+    comment_id: uuid.UUID,
+    current_user_id: uuid.UUID | None,
+    limit: int,
+    cursor: str | None,
+) -> GetCommentThreadCursorResponse:
+
+    comment = await get_comment_brief(db, comment_id)
+    if not comment:
+        raise CommentNotFound()
+
+    cursor_path = None
     if cursor:
-        comment = await get_comment_by_id(db, cursor)
-        if not comment:
-            raise CommentNotFound()
-        elif (
-            post_id and comment.parent_comment_id
-        ):  # post_id로 필터링하는데, 자식댓글로 cursor가 잘못오면
-            raise NotFirstParentComment()
+        cursor_path = decode_cursor(cursor).get("path")
+        # 다른 스레드에서 발급된 cursor
+        if not isinstance(cursor_path, str) or not cursor_path.startswith(comment.path):
+            raise InvalidCursor()
 
-    return await get_comment_list(db, post_id, current_user_id, author, limit, cursor)
+    return await get_comment_thread(
+        db, comment.path, current_user_id, limit, cursor_path
+    )
 
 
 # FR-020: 댓글 수정
@@ -82,7 +172,7 @@ async def service_delete_comment(
     comment_id: uuid.UUID,
 ) -> None:
 
-    comment = await get_comment_by_id(db, comment_id)
+    comment = await get_comment_brief(db, comment_id)
     if not comment:
         raise CommentNotFound()
 
@@ -90,9 +180,7 @@ async def service_delete_comment(
     if current_user_id != comment.user_id:
         raise UserNotCommentOwner()
 
-    post = await get_recruiting_by_id(db, comment.post_id)
-
     # 댓글이 존재하고,
     # 본인의 댓글이라면
     # 댓글 삭제
-    await delete_comment(db, comment, post)
+    await delete_comment(db, comment)
@@ -1,64 +1,123 @@
 # app/services/image_upload.py
 import logging
-import os
 import uuid
 
-import boto3
-from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
-from dotenv import load_dotenv
 from fastapi import HTTPException, UploadFile
 
-logger = logging.getLogger(__name__)
+from app.core.config import settings
+from app.core.image_variants import (
+    IMAGE_KEY_PATTERN,
+    ImageVariantPipeline,
+    build_variant_key,
+)
+from app.core.storage import storage
+from app.exceptions.exceptions import (
+    ImageNotUploaded,
+    InvalidImageUpload,
+    StorageError,
+)
+from app.schemas.image_upload_schema import ImagePresignResponse
 
+logger = logging.getLogger(__name__)
 
-load_dotenv()  # .env 파일 로드
-AWS_ACCESS_KEY = os.getenv("AWS_ACCESS_KEY_ID")
-AWS_SECRET_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
-AWS_REGION = os.getenv("AWS_REGION")
-S3_BUCKET = os.getenv("AWS_S3_BUCKET")
+# 업로드로 받을 수 있는 이미지 형식
+ALLOWED_IMAGE_CONTENT_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
+ALLOWED_IMAGE_EXTENSIONS = {"jpg", "jpeg", "png", "gif", "webp"}
 
-# boto3 S3 클라이언트 생성
-s3_client = boto3.client(
-    "s3",
-    aws_access_key_id=AWS_ACCESS_KEY,
-    aws_secret_access_key=AWS_SECRET_KEY,
-    region_name=AWS_REGION,
+# 업로드된 이미지의 썸네일/WebP variant를 background에서 생성
+image_variant_pipeline = ImageVariantPipeline(
+    storage,
+    queue_size=settings.IMAGE_VARIANT_QUEUE_SIZE,
+    concurrency=settings.IMAGE_VARIANT_CONCURRENCY,
+    process_workers=settings.IMAGE_VARIANT_PROCESS_WORKERS,
 )
 
 
-async def service_upload_image(file: UploadFile) -> str:
-    file_ext = file.filename.split(".")[-1]  # 파일 확장자
+def build_image_key(filename: str) -> str:
+    file_ext = filename.split(".")[-1]  # 파일 확장자
     signed_filename = f"{uuid.uuid4()}.{file_ext}"  # 중복으로 덮어씌우기 방지
-    s3_key = f"uploads/{signed_filename}"
+    return f"uploads/{signed_filename}"
+
+
+def validate_image_upload(filename: str | None, content_type: str | None) -> None:
+    """
+    이미지 형식만 허용 (html/svg 등을 올려 같은 도메인에서 실행되는 것 방지)
+    로컬 저장소는 nginx가 확장자로 Content-Type을 정하므로 확장자도 검사
+    """
+    if content_type not in ALLOWED_IMAGE_CONTENT_TYPES:
+        raise InvalidImageUpload("지원하지 않는 이미지 형식입니다.")
+
+    if not filename or filename.split(".")[-1].lower() not in ALLOWED_IMAGE_EXTENSIONS:
+        raise InvalidImageUpload("파일 확장자를 확인해주세요.")
+
+
+async def service_upload_image(file: UploadFile) -> str:
+    validate_image_upload(file.filename, file.content_type)
+    key = build_image_key(file.filename)
 
     try:
-        s3_client.upload_fileobj(
-            file.file,  # file-like object
-            S3_BUCKET,
-            s3_key,
-            ExtraArgs={"ContentType": file.content_type},
+        await storage.upload(
+            file, key, file.content_type, settings.IMAGE_UPLOAD_MAX_BYTES
         )
-
-        return f"https://{S3_BUCKET}.s3.{AWS_REGION}.amazonaws.com/{s3_key}"
-    except ClientError as e:
-        # AWS 권한, 버킷 문제
-        logger.error(f"AWS ClientError: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="FILE_STORAGE_ERROR")
-    except BotoCoreError as e:
-        # 네트워크 또는 boto3 내부 오류
-        logger.error(f"BotoCoreError: {e}", exc_info=True)
+    except StorageError as e:
+        # 저장소 권한, 네트워크, 디스크 문제
+        logger.error(f"StorageError: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="FILE_STORAGE_ERROR")
-    except NoCredentialsError as e:
-        logger.error(f"NoCredentialsError: {e}", exc_info=True)
+
+    image_variant_pipeline.enqueue(key)
+    return storage.get_url(key)
+
+
+async def service_create_presigned_image_upload(
+    filename: str, content_type: str
+) -> ImagePresignResponse:
+    """
+    브라우저가 API를 거치지 않고 저장소(S3)로 직접 올릴 수 있는 presigned POST 발급
+    Content-Type과 크기(1 ~ IMAGE_UPLOAD_MAX_BYTES)는 S3가 정책으로 검사
+    """
+    validate_image_upload(filename, content_type)
+    key = build_image_key(filename)
+    presigned_post = storage.create_presigned_post(
+        key,
+        content_type,
+        max_size=settings.IMAGE_UPLOAD_MAX_BYTES,
+        expires_in=settings.S3_PRESIGNED_POST_EXPIRE_SECONDS,
+    )
+
+    return ImagePresignResponse(
+        url=presigned_post["url"],
+        fields=presigned_post["fields"],
+        key=key,
+        max_size=settings.IMAGE_UPLOAD_MAX_BYTES,
+        expires_in=settings.S3_PRESIGNED_POST_EXPIRE_SECONDS,
+    )
+
+
+async def service_confirm_image_upload(key: str) -> str:
+    """presigned POST로 올린 이미지가 실제로 있는지 확인 후 공개 URL 반환"""
+    # presigned로 발급한 형식의 key만 확인 (임의 객체 조회 방지)
+    if not IMAGE_KEY_PATTERN.fullmatch(key):
+        raise InvalidImageUpload("유효하지 않은 이미지 key 입니다.")
+
+    try:
+        content_type = await storage.get_content_type(key)
+    except StorageError as e:
+        logger.error(f"StorageError: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="FILE_STORAGE_ERROR")
 
-    # file_path = os.path.join(settings.IMAGE_UPLOAD_DIR, filename)
-    # try:
-    #     os.makedirs(settings.IMAGE_UPLOAD_DIR, exist_ok=True)
-    #     with open(file_path, "wb") as f:
-    #         content = await file.read()
-    #         f.write(content)
-    #     image_url = f"{settings.IMAGE_BASE_URL}/{filename}"
-    #     return image_url
-    # except Exception as e:
-    #     raise HTTPException(status_code=500, detail=f"Error storing file: {str(e)}")
+    if content_type is None:
+        raise ImageNotUploaded()
+    if content_type not in ALLOWED_IMAGE_CONTENT_TYPES:
+        raise InvalidImageUpload("지원하지 않는 이미지 형식입니다.")
+
+    # 같은 key로 confirm을 반복해도 variant는 처음 한 번만 생성
+    try:
+        variant_content_type = await storage.get_content_type(
+            build_variant_key(key, "thumb")
+        )
+    except StorageError as e:
+        logger.error(f"StorageError: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="FILE_STORAGE_ERROR")
+    if variant_content_type is None:
+        image_variant_pipeline.enqueue(key)
+    return storage.get_url(key)
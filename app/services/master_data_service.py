@@ -1,45 +1,84 @@
-# app/services/master_data.py
+# app/services/master_data_service.py
+import gzip
+import hashlib
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.common_model import (
-    ExperienceLevel,
-    Genre,
-    Orientation,
-    Position,
-    RecruitmentType,
-    Region,
-)
-from app.schemas.master_data_schema import OptionOut
-
-
-async def get_all_master_data(db: AsyncSession):
-    regions_result = await db.execute(select(Region))
-    regions = regions_result.scalars().all()
-
-    positions_result = await db.execute(select(Position))
-    positions = positions_result.scalars().all()
-
-    genres_result = await db.execute(select(Genre))
-    genres = genres_result.scalars().all()
-
-    experience_levels_result = await db.execute(select(ExperienceLevel))
-    experience_levels = experience_levels_result.scalars().all()
-
-    orientations_result = await db.execute(select(Orientation))
-    orientations = orientations_result.scalars().all()
-
-    recruitment_types_result = await db.execute(select(RecruitmentType))
-    recruitment_types = recruitment_types_result.scalars().all()
-
-    return {
-        "regions": [OptionOut.model_validate(region) for region in regions],
-        "positions": [OptionOut.model_validate(position) for position in positions],
-        "genres": [OptionOut.model_validate(genre) for genre in genres],
-        "experience_levels": [OptionOut.model_validate(el) for el in experience_levels],
-        "orientations": [
-            OptionOut.model_validate(orientation) for orientation in orientations
-        ],
-        "recruitment_types": [OptionOut.model_validate(rt) for rt in recruitment_types],
-    }
+from app.core.master_data import MASTER_DATA_MODELS, master_data_registry
+from app.schemas.master_data_schema import MasterDataResponse, OptionOut
+
+
+class MasterDataPayload:
+    """미리 직렬화(+ gzip 압축)해 둔 마스터 데이터 응답 본문과 ETag"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        # mtime=0: worker마다 같은 바이트가 나오도록
+        self.gzip_body = gzip.compress(body, mtime=0)
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gzip"'
+
+    def is_not_modified(self, if_none_match: str | None) -> bool:
+        """If-None-Match가 현재 본문(압축 여부 무관)과 일치하는지"""
+        if not if_none_match:
+            return False
+
+        for tag in if_none_match.split(","):
+            tag = tag.strip().removeprefix("W/")
+            if tag in ("*", self.etag, self.gzip_etag):
+                return True
+        return False
+
+
+class MasterDataPayloadCache:
+    """마스터 데이터 registry 내용이 바뀔 때만 응답 본문을 다시 만든다"""
+
+    def __init__(self):
+        self._payload: MasterDataPayload | None = None
+        self._fingerprint: tuple | None = None
+
+    async def get(self, db: AsyncSession) -> MasterDataPayload:
+        # fingerprint 확인은 MASTER_DATA_REFRESH_SECONDS 마다 한 번만 DB 조회
+        await master_data_registry.refresh_if_changed(db)
+
+        fingerprint = master_data_registry.fingerprint
+        if self._payload is None or self._fingerprint != fingerprint:
+            response = MasterDataResponse(
+                **{
+                    model.__tablename__: [
+                        OptionOut(id=item_id, name=name)
+                        for item_id, name in master_data_registry.get_options(model)
+                    ]
+                    for model in MASTER_DATA_MODELS
+                }
+            )
+            self._payload = MasterDataPayload(response.model_dump_json().encode())
+            self._fingerprint = fingerprint
+        return self._payload
+
+
+master_data_payload_cache = MasterDataPayloadCache()
+
+
+async def get_master_data_payload(db: AsyncSession) -> MasterDataPayload:
+    return await master_data_payload_cache.get(db)
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Accept-Encoding에 gzip이 있고 q=0이 아닌지"""
+    for coding in (accept_encoding or "").split(","):
+        name, *params = coding.split(";")
+        if name.strip().lower() != "gzip":
+            continue
+
+        q = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        return q > 0
+    return False
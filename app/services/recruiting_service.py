@@ -1,15 +1,22 @@
+import hashlib
+import json
 import uuid
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 if TYPE_CHECKING:
     from app.api.v1.recruiting_router import SortBy
-from app.crud.comment_crud import get_comment_by_id
+from app.core.config import settings
+from app.core.cursor import decode_cursor
+from app.core.response_cache import ResponseCache
+from app.crud.comment_crud import get_comment_brief
 from app.crud.recruiting_crud import (
     create_comment,
     create_recruiting,
     delete_recruiting,
+    get_bookmarked_post_ids,
     get_recruiting_by_id,
     get_recruiting_detail,
     get_recruiting_list,
@@ -19,6 +26,7 @@ from app.crud.recruiting_crud import (
 )
 from app.exceptions.exceptions import (
     CommentNotFound,
+    InvalidCursor,
     NotFirstParentComment,
     PostNotFound,
     RecruitingCommentNotMatch,
@@ -26,11 +34,105 @@ from app.exceptions.exceptions import (
     UserNotRecruitingPostOwner,
 )
 from app.schemas.comment_schema import CreateCommentRequest
+from app.schemas.enums import RecruitingLoadProfile
 from app.schemas.recruiting_schema import (
-    GetRecruitingCursorResponse,
     GetRecruitingDetailResponse,
     RecruitingDetailRequest,
 )
+from app.services.view_count_service import view_count_service
+
+# 사용자와 무관한 구인글 목록 응답(직렬화된 bytes) 캐시
+# 구인글 생성/수정/마감/삭제 시 비움
+recruiting_list_cache = ResponseCache(
+    ttl_seconds=settings.RECRUITING_LIST_CACHE_TTL_SECONDS,
+    max_bytes=settings.RECRUITING_LIST_CACHE_MAX_BYTES,
+)
+
+
+def build_recruiting_cursor_scope(
+    search_query: str | None,
+    author: uuid.UUID | None,
+    bookmarks: str | None,
+    orientation: uuid.UUID | None,
+    experienced_level: uuid.UUID | None,
+    region_ids: list[uuid.UUID] | None,
+    position_ids: list[uuid.UUID] | None,
+    genre_ids: list[uuid.UUID] | None,
+) -> dict:
+    """
+    cursor에 함께 서명할 목록 조건: 검색어 + 필터 hash (정렬 기준은 crud에서 추가)
+    다른 조건의 목록에 cursor를 재사용하면 InvalidCursor
+    """
+    filters = json.dumps(
+        [
+            author,
+            bookmarks,
+            orientation,
+            experienced_level,
+            sorted(set(region_ids or [])),
+            sorted(set(position_ids or [])),
+            sorted(set(genre_ids or [])),
+        ],
+        default=str,
+    )
+    return {
+        "query": search_query,
+        "filters": hashlib.sha256(filters.encode("utf-8")).hexdigest()[:16],
+    }
+
+
+def parse_recruiting_cursor(
+    cursor: str, sort_by: "SortBy", cursor_scope: dict
+) -> tuple[int | float | None, datetime, uuid.UUID]:
+    """
+    구인글 목록 cursor를 (정렬 값, created_at, id)로 복원
+    다른 정렬 기준/검색어/필터로 만든 cursor이거나 값이 잘못되면 InvalidCursor
+    """
+    payload = decode_cursor(cursor)
+    if payload.get("sort_by") != sort_by.value:
+        raise InvalidCursor()
+    for key, value in cursor_scope.items():
+        if payload.get(key) != value:
+            raise InvalidCursor()
+
+    sort_value = payload.get("sort_value")
+    if sort_value is not None and (
+        isinstance(sort_value, bool) or not isinstance(sort_value, (int, float))
+    ):
+        raise InvalidCursor()
+
+    try:
+        created_at = datetime.fromisoformat(payload["created_at"])
+        post_id = uuid.UUID(payload["id"])
+    except (KeyError, TypeError, ValueError):
+        raise InvalidCursor()
+
+    return sort_value, created_at, post_id
+
+
+async def apply_recruiting_list_user_fields(
+    db: AsyncSession, body: bytes, current_user_id: uuid.UUID
+) -> bytes:
+    """
+    캐시된 목록 응답에 사용자별 필드(is_owner, is_bookmarked)만 덮어씀
+    응답 전체를 Pydantic으로 다시 검증하지 않도록 dict 그대로 수정
+    """
+    response = json.loads(body)
+    posts = response.get("posts")
+    if not posts:
+        return body
+
+    bookmarked_post_ids = await get_bookmarked_post_ids(
+        db, current_user_id, [uuid.UUID(post["id"]) for post in posts]
+    )
+    current_user_id_str = str(current_user_id)
+    for post in posts:
+        author = post.get("author")
+        post["is_owner"] = author is not None and author["id"] == current_user_id_str
+        post["is_bookmarked"] = uuid.UUID(post["id"]) in bookmarked_post_ids
+
+    # model_dump_json과 같은 형식 (공백 없음, UTF-8)
+    return json.dumps(response, ensure_ascii=False, separators=(",", ":")).encode()
 
 
 # FR-011: 구인글 목록 조회
@@ -38,7 +140,7 @@ async def service_get_recruiting_list(
     db: AsyncSession,
     current_user_id: uuid.UUID,
     limit: int,
-    cursor: uuid.UUID | None,
+    cursor: str | None,
     author: uuid.UUID | None,
     bookmarks: str | None,
     search_query: str | None,
@@ -48,22 +150,58 @@ async def service_get_recruiting_list(
     position_ids: list[uuid.UUID] | None,
     genre_ids: list[uuid.UUID] | None,
     sort_by: "SortBy",
-) -> GetRecruitingCursorResponse:
+) -> bytes:
+    """
+    직렬화된 GetRecruitingCursorResponse(JSON bytes)를 반환
+    bookmarks=me 를 제외한 요청은 비로그인 기준 응답을 캐시해 공유하고,
+    로그인 사용자는 사용자별 필드만 덮어씀
+    """
+
+    cache_key = None
+    if not bookmarks:
+        cache_key = (
+            limit,
+            cursor,
+            author,
+            search_query,
+            orientation,
+            experienced_level,
+            tuple(sorted(set(region_ids))) if region_ids else None,
+            tuple(sorted(set(position_ids))) if position_ids else None,
+            tuple(sorted(set(genre_ids))) if genre_ids else None,
+            sort_by.value,
+        )
+        body = recruiting_list_cache.get(cache_key)
+        if body is not None:
+            if current_user_id:
+                return await apply_recruiting_list_user_fields(
+                    db, body, current_user_id
+                )
+            return body
 
     if author:
         user = await get_user_by_id(db, author=author)
         if user is None:
             raise UserNotFound()
-    if cursor:
-        recruiting = await get_recruiting_by_id(db, cursor)
-        if recruiting is None:
-            raise PostNotFound()
 
-    return await get_recruiting_list(
+    cursor_scope = build_recruiting_cursor_scope(
+        search_query,
+        author,
+        bookmarks,
+        orientation,
+        experienced_level,
+        region_ids,
+        position_ids,
+        genre_ids,
+    )
+    get_recruiting_cursor_response = await get_recruiting_list(
         db,
-        current_user_id=current_user_id,
+        # 캐시할 응답은 사용자와 무관하게 조회
+        current_user_id=current_user_id if cache_key is None else None,
         limit=limit,
-        cursor=cursor,
+        cursor=(
+            parse_recruiting_cursor(cursor, sort_by, cursor_scope) if cursor else None
+        ),
         author=author,
         bookmarks=bookmarks,
         search_query=search_query,
@@ -73,7 +211,17 @@ async def service_get_recruiting_list(
         position_ids=position_ids,
         genre_ids=genre_ids,
         sort_by=sort_by,
+        cursor_scope=cursor_scope,
     )
+    body = get_recruiting_cursor_response.model_dump_json().encode()
+
+    if cache_key is None:
+        return body
+
+    recruiting_list_cache.set(cache_key, body)
+    if current_user_id:
+        return await apply_recruiting_list_user_fields(db, body, current_user_id)
+    return body
 
 
 # FR-014: 구인글 생성
@@ -83,6 +231,7 @@ async def service_create_recruiting(
     create_recruiting_request: RecruitingDetailRequest,
 ) -> None:
     await create_recruiting(db, current_user_id, create_recruiting_request)
+    recruiting_list_cache.clear()
 
 
 # FR-012: 구인글 상세 조회
@@ -92,15 +241,26 @@ async def service_get_recruiting_detail(
     current_user_id: uuid.UUID,
 ) -> GetRecruitingDetailResponse:
 
-    post = await get_recruiting_by_id(db, post_id)
+    post = await get_recruiting_by_id(
+        db, post_id, load_profile=RecruitingLoadProfile.DETAIL
+    )
     if not post:
         raise PostNotFound()
 
+    # 조회수 +1 (DB 쓰기 없이 메모리에 누적)
+    view_count_service.increment(post.id)
+
     get_recruiting_detail_response = await get_recruiting_detail(
         db, post, current_user_id
     )
 
-    return get_recruiting_detail_response
+    # 아직 DB에 반영되지 않은 조회수까지 더해서 응답
+    return get_recruiting_detail_response.model_copy(
+        update={
+            "views_count": post.stats.views_count
+            + view_count_service.get_pending_count(post.id)
+        }
+    )
 
 
 # FR-015: 구인글 수정
@@ -111,7 +271,9 @@ async def service_update_recruiting_detail(
     update_recruiting_detail_request: RecruitingDetailRequest,
 ) -> None:
 
-    post = await get_recruiting_by_id(db, post_id)
+    post = await get_recruiting_by_id(
+        db, post_id, load_profile=RecruitingLoadProfile.OWNERSHIP
+    )
     if not post:
         raise PostNotFound()
 
@@ -121,6 +283,7 @@ async def service_update_recruiting_detail(
 
     # 게시글이 있다면, 정보를 수정하고 저장
     await update_recruiting_detail(db, post, update_recruiting_detail_request)
+    recruiting_list_cache.clear()
 
 
 # FR-016: 구인글 마감 상태 변경
@@ -129,7 +292,9 @@ async def service_update_recruiting_is_closed_status(
 ) -> None:
 
     # CRUD 레이어 호출
-    post = await get_recruiting_by_id(db, post_id=post_id)
+    post = await get_recruiting_by_id(
+        db, post_id=post_id, load_profile=RecruitingLoadProfile.OWNERSHIP
+    )
     if not post:
         raise PostNotFound()
 
@@ -139,6 +304,7 @@ async def service_update_recruiting_is_closed_status(
 
     # 구인글이 있다면, 마감 상태를 변경
     await update_recruiting_is_closed_status(db, post, is_closed)
+    recruiting_list_cache.clear()
 
 
 # FR-017: 구인글 삭제
@@ -147,7 +313,9 @@ async def service_delete_recruiting(
 ) -> None:
 
     # CRUD 레이어 호출
-    post = await get_recruiting_by_id(db, post_id=post_id)
+    post = await get_recruiting_by_id(
+        db, post_id=post_id, load_profile=RecruitingLoadProfile.OWNERSHIP
+    )
     if not post:
         raise PostNotFound()
 
@@ -157,6 +325,7 @@ async def service_delete_recruiting(
 
     # 구인글이 있다면, 삭제
     await delete_recruiting(db, post)
+    recruiting_list_cache.clear()
 
 
 ### Comment ###
@@ -173,15 +342,19 @@ async def service_create_comment(
     if not post:
         raise PostNotFound()
 
+    parent_path = None
     if create_comment_request.parent_comment_id:
-        parent_comment = await get_comment_by_id(
+        parent_comment = await get_comment_brief(
             db, create_comment_request.parent_comment_id
         )
         if not parent_comment:
             raise CommentNotFound()
         elif parent_comment.parent_comment_id:  # 최상위 부모 댓글이 아니면,
             raise NotFirstParentComment()
-        elif parent_comment.post.id != post_id:
+        elif parent_comment.post_id != post_id:
             raise RecruitingCommentNotMatch()
+        parent_path = parent_comment.path
 
-    await create_comment(db, current_user_id, post, create_comment_request)
+    await create_comment(
+        db, current_user_id, post, create_comment_request, parent_path=parent_path
+    )
@@ -0,0 +1,67 @@
+# app/services/refresh_token_purge_service.py
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.revoked_tokens import revoked_token_index
+from app.crud.refresh_token_crud import purge_refresh_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshTokenPurgeService:
+    """
+    만료되었거나 폐기된 refresh token 행을 일정 주기마다 batch 단위로 삭제
+    (batch마다 commit하여 잠금과 트랜잭션을 짧게 유지)
+    메모리의 폐기 jti 인덱스도 같은 주기로 정리
+    """
+
+    def __init__(self, interval_seconds: float, batch_size: int):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._purge_task: asyncio.Task | None = None
+
+    async def purge(self) -> int:
+        revoked_token_index.prune()
+
+        total = 0
+        try:
+            async with AsyncSessionLocal() as session:
+                while True:
+                    deleted = await purge_refresh_tokens(session, self.batch_size)
+                    await session.commit()
+                    total += deleted
+                    if deleted < self.batch_size:
+                        break
+        except Exception as e:
+            # 남은 행은 다음 주기에 다시 삭제
+            logger.error(f"Failed to purge refresh tokens: {e}", exc_info=True)
+
+        if total:
+            logger.info("purged %d refresh tokens", total)
+        return total
+
+    async def _run_purge_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.purge()
+
+    def start(self) -> None:
+        if self._purge_task is None:
+            self._purge_task = asyncio.create_task(self._run_purge_loop())
+
+    async def stop(self) -> None:
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            try:
+                await self._purge_task
+            except asyncio.CancelledError:
+                pass
+            self._purge_task = None
+
+
+refresh_token_purge_service = RefreshTokenPurgeService(
+    interval_seconds=settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS,
+    batch_size=settings.REFRESH_TOKEN_PURGE_BATCH_SIZE,
+)
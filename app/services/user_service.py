@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import delete, select
 
+from app.core.principal_cache import principal_cache
 from app.core.security import get_password_hash
 from app.models.common_model import Genre, Region
 from app.models.user_model import Profile, ProfilePositionLink, User
@@ -29,7 +30,7 @@ class UserService:
                 detail="Email already registered",
             )
         user_data = user_create.model_dump()
-        hashed_password = get_password_hash(user_data.pop("password"))
+        hashed_password = await get_password_hash(user_data.pop("password"))
         user_data["password_hash"] = hashed_password
         user_data["login_type"] = "email"
         db_user = User(**user_data)
@@ -43,6 +44,17 @@ class UserService:
         self, db: AsyncSession, user: User, profile_update: ProfileUpdate
     ) -> Profile:
         """사용자의 프로필을 생성하거나 수정"""
+        # 0. principal 캐시의 객체는 세션에서 분리되어 있으므로 현재 세션에서 다시 로드
+        #    (merge는 캐시 시점의 값으로 bookmark_count 등을 덮어쓸 수 있어 사용하지 않음)
+        user = await db.get(
+            User,
+            user.id,
+            options=[
+                selectinload(User.profile).selectinload(Profile.regions),
+                selectinload(User.profile).selectinload(Profile.genres),
+            ],
+        )
+
         # 1. 사용자의 프로필이 없으면 새로 생성
         profile = user.profile
         if not profile:
@@ -93,6 +105,7 @@ class UserService:
             db.add_all(new_links)
 
         await db.commit()
+        principal_cache.invalidate(user.id)
         await db.refresh(profile)
 
         statement = (
@@ -116,11 +129,14 @@ class UserService:
 
     async def delete_user(self, db: AsyncSession, user: User):
         """사용자 정보를 DB에서 영구적으로 삭제"""
+        # principal 캐시의 객체는 세션에서 분리되어 있으므로 현재 세션에서 다시 로드
+        user = await db.get(User, user.id, options=[selectinload(User.profile)])
         profile = user.profile
         if profile:
             await db.delete(profile)
         await db.delete(user)
         await db.commit()
+        principal_cache.invalidate(user.id)
 
 
 # 서비스 객체 생성
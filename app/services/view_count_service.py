@@ -0,0 +1,93 @@
+# app/services/view_count_service.py
+import asyncio
+import logging
+import uuid
+from collections import Counter
+
+from sqlalchemy import bindparam, update
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models import RecruitingPostStats
+
+logger = logging.getLogger(__name__)
+
+recruiting_post_stats_table = RecruitingPostStats.__table__
+
+# executemany로 한 번에 실행: views_count = views_count + n
+increment_views_count_stmt = (
+    update(recruiting_post_stats_table)
+    .where(recruiting_post_stats_table.c.post_id == bindparam("b_post_id"))
+    .values(
+        views_count=recruiting_post_stats_table.c.views_count + bindparam("increment"),
+    )
+)
+
+
+class ViewCountService:
+    """
+    구인글 조회수를 worker 메모리에 모아두었다가
+    일정 주기마다(그리고 종료 시) 한 번에 DB에 반영
+    """
+
+    def __init__(self, flush_interval_seconds: float):
+        self.flush_interval_seconds = flush_interval_seconds
+        self._pending: Counter[uuid.UUID] = Counter()
+        self._flush_task: asyncio.Task | None = None
+
+    def increment(self, post_id: uuid.UUID) -> None:
+        self._pending[post_id] += 1
+
+    def get_pending_count(self, post_id: uuid.UUID) -> int:
+        """아직 DB에 반영되지 않은 조회수"""
+        return self._pending.get(post_id, 0)
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, Counter()
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(
+                    increment_views_count_stmt,
+                    # 여러 worker가 같은 행을 같은 순서로 잠그도록 post_id 순 (deadlock 방지)
+                    [
+                        {"b_post_id": post_id, "increment": increment}
+                        for post_id, increment in sorted(pending.items())
+                    ],
+                )
+                await session.commit()
+        except Exception as e:
+            # 실패한 조회수는 다음 flush에서 다시 시도
+            self._pending.update(pending)
+            logger.error(f"Failed to flush view counts: {e}", exc_info=True)
+        except BaseException:
+            # flush 도중 취소(stop)되면 되돌려 두고 stop()의 마지막 flush에서 반영
+            self._pending.update(pending)
+            raise
+
+    async def _run_flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await self.flush()
+
+    def start(self) -> None:
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._run_flush_loop())
+
+    async def stop(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        await self.flush()
+
+
+view_count_service = ViewCountService(
+    flush_interval_seconds=settings.VIEW_COUNT_FLUSH_SECONDS
+)
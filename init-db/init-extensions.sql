@@ -1,2 +1,3 @@
 -- init-db/init-extensions.sql
 CREATE EXTENSION IF NOT EXISTS pg_uuidv7;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
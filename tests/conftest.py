@@ -0,0 +1,67 @@
+# tests/conftest.py
+import asyncio
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db_connection():
+    """
+    docker-compose의 Postgres 연결 (alembic upgrade head 적용 후 실행)
+    DB가 떠 있지 않으면 skip, 테스트가 끝나면 rollback
+    """
+    engine = create_async_engine(settings.DATABASE_URL)
+    try:
+        connection = await engine.connect()
+    except OperationalError as e:
+        await engine.dispose()
+        pytest.skip(f"Postgres is not available: {e}")
+
+    transaction = await connection.begin()
+    try:
+        yield connection
+    finally:
+        await transaction.rollback()
+        await connection.close()
+        await engine.dispose()
+
+
+class EventLoopLagMonitor:
+    """heartbeat task가 interval보다 늦게 깨어난 최대 시간(초) = 이벤트 루프가 막힌 시간"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.max_lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started_at = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = loop.time() - started_at - self.interval
+            self.max_lag = max(self.max_lag, lag)
+
+    async def __aenter__(self) -> "EventLoopLagMonitor":
+        self._task = asyncio.create_task(self._run())
+        # heartbeat가 한 번은 시작되도록 양보
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+
+@pytest.fixture
+def event_loop_lag_monitor():
+    return EventLoopLagMonitor()
@@ -0,0 +1,94 @@
+# tests/test_image_variants.py
+"""업로드 이미지 variant(썸네일/WebP) 생성과 variant URL 확인"""
+
+import io
+import uuid
+
+from PIL import Image
+
+from app.core.image_variants import (
+    build_variant_key,
+    get_image_variant_url,
+    render_image_variants,
+)
+from app.core.storage import storage
+from app.schemas.recruiting_schema import GetUserProfileResponse
+
+EXIF_ORIENTATION_TAG = 0x0112
+EXIF_ROTATE_90_CW = 6
+
+
+def open_variant(data: bytes) -> Image.Image:
+    image = Image.open(io.BytesIO(data))
+    assert image.format == "WEBP"
+    return image
+
+
+def test_render_palette_png_keeps_transparency():
+    image = Image.new("P", (800, 400), 0)
+    image.putpalette([0, 0, 0, 255, 0, 0])
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", transparency=0)
+
+    variants = render_image_variants(buffer.getvalue())
+
+    thumb = open_variant(variants["thumb"])
+    assert thumb.size == (160, 160)
+    assert thumb.mode == "RGBA"
+    assert thumb.getpixel((0, 0))[3] == 0
+
+    medium = open_variant(variants["medium"])
+    assert medium.size == (640, 320)
+    assert medium.mode == "RGBA"
+
+
+def test_render_exif_rotated_jpeg():
+    # 가로로 저장되었지만 EXIF상 90도 회전 -> 세로 이미지
+    image = Image.new("RGB", (400, 300), (255, 255, 255))
+    exif = Image.Exif()
+    exif[EXIF_ORIENTATION_TAG] = EXIF_ROTATE_90_CW
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", exif=exif)
+
+    variants = render_image_variants(buffer.getvalue())
+
+    thumb = open_variant(variants["thumb"])
+    assert thumb.size == (160, 160)
+    assert thumb.mode == "RGB"
+
+    # medium은 확대하지 않으므로 회전된 원본 크기 그대로
+    medium = open_variant(variants["medium"])
+    assert medium.size == (300, 400)
+    assert medium.mode == "RGB"
+
+
+def test_uploaded_image_has_variant_url():
+    stem = uuid.uuid4()
+    image_url = storage.get_url(f"uploads/{stem}.png")
+
+    assert build_variant_key(f"uploads/{stem}.png", "thumb") == (
+        f"uploads/{stem}_thumb.webp"
+    )
+    assert get_image_variant_url(image_url, "thumb") == storage.get_url(
+        f"uploads/{stem}_thumb.webp"
+    )
+    assert GetUserProfileResponse(
+        id=uuid.uuid4(), nickname="user", image_url=image_url
+    ).image_thumbnail_url == storage.get_url(f"uploads/{stem}_thumb.webp")
+
+
+def test_non_upload_image_has_no_variant_url():
+    # 소셜 로그인 프로필 이미지 등 저장소 밖의 URL
+    for image_url in (
+        None,
+        "https://lh3.googleusercontent.com/a/profile-image",
+        "http://k.kakaocdn.net/dn/profile.jpg",
+        storage.get_url("other/profile.png"),
+    ):
+        assert get_image_variant_url(image_url, "thumb") is None
+        assert (
+            GetUserProfileResponse(
+                id=uuid.uuid4(), nickname="user", image_url=image_url
+            ).image_thumbnail_url
+            is None
+        )
@@ -0,0 +1,39 @@
+# tests/test_password_hasher_event_loop.py
+"""bcrypt 해싱/검증이 이벤트 루프를 막지 않는지 확인"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.core.security import PasswordHasher, pwd_context
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def password_hasher():
+    hasher = PasswordHasher(max_workers=4)
+    yield hasher
+    hasher.shutdown()
+
+
+async def test_hashing_does_not_block_event_loop(
+    password_hasher, event_loop_lag_monitor
+):
+    # 이벤트 루프에서 직접 실행했다면 막혔을 시간
+    started_at = time.perf_counter()
+    hashed_password = pwd_context.hash("password")
+    hash_seconds = time.perf_counter() - started_at
+
+    async with event_loop_lag_monitor:
+        results = await asyncio.gather(
+            *(password_hasher.hash(f"password-{i}") for i in range(4)),
+            *(password_hasher.verify("password", hashed_password) for _ in range(4)),
+        )
+
+    assert all(results[4:])
+    assert event_loop_lag_monitor.max_lag < hash_seconds / 2
+    stats = password_hasher.get_stats()
+    assert stats["running"] == 0
+    assert stats["queued"] == 0
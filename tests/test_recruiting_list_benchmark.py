@@ -0,0 +1,186 @@
+# tests/test_recruiting_list_benchmark.py
+"""
+구인글 목록 한 페이지의 CPU 시간/메모리 비교
+- entity: RecruitingPost 엔티티 전체 로드 후 __dict__ -> model_validate (이전 방식)
+- projection: 카드 컬럼만 Core select (get_recruiting_list)
+
+    docker compose up -d db
+    poetry run alembic upgrade head
+    poetry run pytest -s tests/test_recruiting_list_benchmark.py
+"""
+
+import time
+import tracemalloc
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, selectinload
+from sqlmodel import desc, select
+
+from app.crud.recruiting_crud import get_positions_by_post_ids, get_recruiting_list
+from app.models import (
+    Genre,
+    Profile,
+    RecruitingPost,
+    RecruitingPostGenreLink,
+    RecruitingPostRegionLink,
+    RecruitingPostStats,
+    Region,
+    User,
+)
+from app.schemas.enums import SortBy
+from app.schemas.recruiting_schema import GetRecruitingListResponse
+
+pytestmark = pytest.mark.anyio
+
+POST_COUNT = 200
+CONTENT_LENGTH = 4000  # 목록에서는 내려주지 않는 본문
+PAGE_SIZE = 20
+REPEAT = 50
+
+
+async def get_recruiting_list_with_entities(
+    db: AsyncSession, current_user_id: uuid.UUID, limit: int
+) -> list[GetRecruitingListResponse]:
+    """column projection 이전의 목록 조회 방식"""
+    stmt = (
+        select(RecruitingPost)
+        .options(
+            defer(RecruitingPost.search_document),
+            selectinload(RecruitingPost.author).selectinload(User.profile),
+            selectinload(RecruitingPost.regions),
+            selectinload(RecruitingPost.genres),
+            selectinload(RecruitingPost.stats),
+        )
+        .order_by(desc(RecruitingPost.created_at), desc(RecruitingPost.id))
+        .limit(limit + 1)
+    )
+    posts = (await db.execute(stmt)).scalars().all()[:limit]
+    positions_by_post_id = await get_positions_by_post_ids(db, [p.id for p in posts])
+
+    posts_response = []
+    for post in posts:
+        post_data = dict(post.__dict__)
+        post_data["author"] = {
+            "id": post.author.id,
+            "nickname": post.author.nickname,
+            "image_url": post.author.profile.image_url if post.author.profile else None,
+        }
+        post_data["is_owner"] = post.user_id == current_user_id
+        post_data["is_bookmarked"] = False
+        post_data["views_count"] = post.stats.views_count
+        post_data["comments_count"] = post.stats.comments_count
+        post_data["bookmarks_count"] = post.stats.bookmarks_count
+        post_data["positions"] = positions_by_post_id[post.id]
+        posts_response.append(GetRecruitingListResponse.model_validate(post_data))
+    return posts_response
+
+
+async def get_recruiting_list_with_projection(
+    db: AsyncSession, current_user_id: uuid.UUID, limit: int
+) -> list[GetRecruitingListResponse]:
+    response = await get_recruiting_list(
+        db,
+        current_user_id=current_user_id,
+        limit=limit,
+        cursor=None,
+        author=None,
+        bookmarks=None,
+        search_query=None,
+        orientation=None,
+        experienced_level=None,
+        region_ids=None,
+        position_ids=None,
+        genre_ids=None,
+        sort_by=SortBy.LATEST,
+    )
+    return response.posts
+
+
+async def seed_recruiting_posts(connection) -> uuid.UUID:
+    async with AsyncSession(
+        bind=connection, join_transaction_mode="create_savepoint"
+    ) as session:
+        region_ids = list((await session.execute(select(Region.id).limit(3))).scalars())
+        genre_ids = list((await session.execute(select(Genre.id).limit(3))).scalars())
+
+        user = User(
+            email=f"benchmark-{uuid.uuid4().hex}@example.com",
+            nickname="benchmark",
+            login_type="email",
+        )
+        session.add(user)
+        await session.flush()
+        session.add(Profile(user_id=user.id))
+
+        posts = [
+            RecruitingPost(
+                user_id=user.id,
+                title=f"벤치마크 구인글 {i}",
+                content="가" * CONTENT_LENGTH,
+            )
+            for i in range(POST_COUNT)
+        ]
+        session.add_all(posts)
+        await session.flush()
+
+        for post in posts:
+            session.add(
+                RecruitingPostStats(post_id=post.id, created_at=post.created_at)
+            )
+            session.add_all(
+                RecruitingPostRegionLink(post_id=post.id, region_id=region_id)
+                for region_id in region_ids
+            )
+            session.add_all(
+                RecruitingPostGenreLink(post_id=post.id, genre_id=genre_id)
+                for genre_id in genre_ids
+            )
+        await session.flush()
+        return user.id
+
+
+async def measure(connection, get_page, current_user_id) -> tuple[float, int]:
+    """(페이지당 CPU 시간(ms), 페이지 하나를 만드는 동안 최대 메모리(bytes))"""
+
+    async def run_page():
+        # 매번 새 세션: identity map에 남은 엔티티를 재사용하지 않도록
+        async with AsyncSession(
+            bind=connection, join_transaction_mode="create_savepoint"
+        ) as session:
+            posts = await get_page(session, current_user_id, PAGE_SIZE)
+            assert len(posts) == PAGE_SIZE
+
+    await run_page()  # warm-up (SQL 컴파일 캐시, 마스터 데이터 로드)
+
+    started_at = time.process_time()
+    for _ in range(REPEAT):
+        await run_page()
+    cpu_ms = (time.process_time() - started_at) / REPEAT * 1000
+
+    tracemalloc.start()
+    try:
+        await run_page()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return cpu_ms, peak_bytes
+
+
+async def test_projection_uses_less_memory_than_entities(db_connection):
+    current_user_id = await seed_recruiting_posts(db_connection)
+
+    entity_cpu_ms, entity_peak = await measure(
+        db_connection, get_recruiting_list_with_entities, current_user_id
+    )
+    projection_cpu_ms, projection_peak = await measure(
+        db_connection, get_recruiting_list_with_projection, current_user_id
+    )
+
+    print(
+        f"\nentity:     {entity_cpu_ms:.2f} ms/page, peak {entity_peak / 1024:.0f} KiB"
+        f"\nprojection: {projection_cpu_ms:.2f} ms/page,"
+        f" peak {projection_peak / 1024:.0f} KiB"
+    )
+    assert projection_peak < entity_peak
@@ -0,0 +1,144 @@
+# tests/test_recruiting_list_indexes.py
+"""
+구인글 목록의 정렬(SortBy)/필터가 인덱스를 사용하는지 EXPLAIN으로 확인
+
+    docker compose up -d db
+    poetry run alembic upgrade head
+    poetry run pytest tests/test_recruiting_list_indexes.py
+"""
+
+import json
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.crud.recruiting_crud import get_recruiting_list
+from app.schemas.enums import SortBy
+
+pytestmark = pytest.mark.anyio
+
+
+class StatementCaptured(Exception):
+    pass
+
+
+class CaptureSession:
+    """첫 번째 execute의 statement만 받아두고 실행하지 않는 세션"""
+
+    statement = None
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statement = statement
+        raise StatementCaptured()
+
+
+async def explain_recruiting_list(connection, **options) -> list[dict]:
+    """EXPLAIN (FORMAT JSON)의 모든 plan node"""
+    params = {
+        "current_user_id": uuid.uuid4(),
+        "limit": 20,
+        "cursor": None,
+        "author": None,
+        "bookmarks": None,
+        "search_query": None,
+        "orientation": None,
+        "experienced_level": None,
+        "region_ids": None,
+        "position_ids": None,
+        "genre_ids": None,
+        "sort_by": SortBy.LATEST,
+    }
+    params.update(options)
+
+    session = CaptureSession()
+    with pytest.raises(StatementCaptured):
+        await get_recruiting_list(session, **params)
+
+    compiled = session.statement.compile(
+        dialect=connection.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    # 테스트 DB는 데이터가 거의 없어서 seq scan이 항상 싸므로 끄고 비교
+    await connection.execute(text("SET LOCAL enable_seqscan = off"))
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    )
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    nodes = []
+    stack = [plan[0]["Plan"]]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node.get("Plans", []))
+    return nodes
+
+
+def get_index_names(nodes: list[dict], node_types: tuple[str, ...] | None = None):
+    return {
+        node["Index Name"]
+        for node in nodes
+        if "Index Name" in node
+        and (node_types is None or node["Node Type"] in node_types)
+    }
+
+
+@pytest.mark.parametrize(
+    ("sort_by", "index_name"),
+    [
+        (SortBy.LATEST, "ix_recruiting_posts_created_at_id"),
+        (SortBy.VIEWS, "ix_recruiting_post_stats_views_count_created_at_post_id"),
+        (
+            SortBy.COMMENTS,
+            "ix_recruiting_post_stats_comments_count_created_at_post_id",
+        ),
+        (
+            SortBy.BOOKMARK,
+            "ix_recruiting_post_stats_bookmarks_count_created_at_post_id",
+        ),
+    ],
+)
+async def test_sort_uses_keyset_index(db_connection, sort_by, index_name):
+    nodes = await explain_recruiting_list(db_connection, sort_by=sort_by)
+    # 인덱스 순서대로 읽고 LIMIT에서 멈춤: 정렬 단계가 없어야 함
+    assert not any("Sort" in node["Node Type"] for node in nodes), nodes
+    assert index_name in get_index_names(
+        nodes, ("Index Scan", "Index Only Scan")
+    ), nodes
+
+
+async def test_relevance_search_uses_trigram_index(db_connection):
+    nodes = await explain_recruiting_list(
+        db_connection, search_query="드러머 구합니다", sort_by=SortBy.RELEVANCE
+    )
+    assert "ix_recruiting_posts_search_document_trgm" in get_index_names(nodes), nodes
+
+
+@pytest.mark.parametrize(
+    ("options", "index_name"),
+    [
+        ({"author": uuid.uuid4()}, "ix_recruiting_posts_user_id_created_at_id"),
+        ({"orientation": uuid.uuid4()}, "ix_recruiting_posts_orientation_id"),
+        (
+            {"region_ids": [uuid.uuid4()]},
+            "ix_recruiting_post_regions_region_id_post_id",
+        ),
+        (
+            {"genre_ids": [uuid.uuid4()]},
+            "ix_recruiting_post_genres_genre_id_post_id",
+        ),
+        (
+            {"position_ids": [uuid.uuid4()]},
+            "ix_recruiting_post_positions_position_id_post_id",
+        ),
+        (
+            {"experienced_level": uuid.uuid4()},
+            "ix_recruiting_post_positions_experience_level_id_post_id",
+        ),
+    ],
+)
+async def test_filter_uses_index(db_connection, options, index_name):
+    nodes = await explain_recruiting_list(db_connection, **options)
+    assert index_name in get_index_names(nodes), nodes
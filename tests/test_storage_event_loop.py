@@ -0,0 +1,101 @@
+# tests/test_storage_event_loop.py
+"""S3 업로드가 블로킹 호출(boto3) 동안 이벤트 루프를 막지 않는지 확인"""
+
+import asyncio
+import io
+import time
+
+import pytest
+from fastapi import UploadFile
+
+from app.core.storage import S3StorageBackend
+
+pytestmark = pytest.mark.anyio
+
+# boto3 호출 하나가 걸리는 시간 (네트워크 대기 흉내)
+S3_CALL_SECONDS = 0.2
+PART_SIZE = S3StorageBackend.MIN_PART_SIZE
+MAX_SIZE = PART_SIZE * 3
+
+
+class SlowS3Client:
+    """put_object/upload_part 등에서 time.sleep으로 스레드를 막는 가짜 boto3 client"""
+
+    def __init__(self):
+        self.calls = []
+
+    def _block(self, method_name: str) -> None:
+        self.calls.append(method_name)
+        time.sleep(S3_CALL_SECONDS)
+
+    def put_object(self, **kwargs):
+        self._block("put_object")
+        return {}
+
+    def create_multipart_upload(self, **kwargs):
+        self._block("create_multipart_upload")
+        return {"UploadId": "upload-id"}
+
+    def upload_part(self, **kwargs):
+        self._block("upload_part")
+        return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+    def complete_multipart_upload(self, **kwargs):
+        self._block("complete_multipart_upload")
+        return {}
+
+    def abort_multipart_upload(self, **kwargs):
+        self._block("abort_multipart_upload")
+        return {}
+
+
+@pytest.fixture
+def s3_storage():
+    storage = S3StorageBackend(
+        bucket="bucket", region="ap-northeast-2", max_concurrency=4, part_size=0
+    )
+    storage._client = SlowS3Client()
+    yield storage
+    storage.shutdown()
+
+
+def make_upload_file(size: int) -> UploadFile:
+    return UploadFile(file=io.BytesIO(b"x" * size), filename="image.png")
+
+
+async def test_small_uploads_do_not_block_event_loop(
+    s3_storage, event_loop_lag_monitor
+):
+    async with event_loop_lag_monitor:
+        await asyncio.gather(
+            *(
+                s3_storage.upload(
+                    make_upload_file(1024), f"uploads/{i}.png", None, MAX_SIZE
+                )
+                for i in range(4)
+            )
+        )
+
+    assert s3_storage.client.calls == ["put_object"] * 4
+    assert event_loop_lag_monitor.max_lag < S3_CALL_SECONDS / 2
+
+
+async def test_multipart_upload_does_not_block_event_loop(
+    s3_storage, event_loop_lag_monitor
+):
+    async with event_loop_lag_monitor:
+        await s3_storage.upload(
+            make_upload_file(PART_SIZE * 2 + 1),
+            "uploads/large.png",
+            "image/png",
+            MAX_SIZE,
+        )
+
+    assert s3_storage.client.calls == [
+        "create_multipart_upload",
+        "upload_part",
+        "upload_part",
+        "upload_part",
+        "complete_multipart_upload",
+    ]
+    assert event_loop_lag_monitor.max_lag < S3_CALL_SECONDS / 2
@@ -0,0 +1,97 @@
+# tests/test_storage_upload_size.py
+"""업로드 크기가 max_size를 넘으면 저장하던 내용을 지우고 InvalidImageUpload"""
+
+import io
+import os
+
+import pytest
+from fastapi import UploadFile
+
+from app.core.storage import LocalStorageBackend, S3StorageBackend
+from app.exceptions.exceptions import InvalidImageUpload
+
+pytestmark = pytest.mark.anyio
+
+PART_SIZE = S3StorageBackend.MIN_PART_SIZE
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.calls = []
+
+    def put_object(self, **kwargs):
+        self.calls.append("put_object")
+        return {}
+
+    def create_multipart_upload(self, **kwargs):
+        self.calls.append("create_multipart_upload")
+        return {"UploadId": "upload-id"}
+
+    def upload_part(self, **kwargs):
+        self.calls.append("upload_part")
+        return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+    def complete_multipart_upload(self, **kwargs):
+        self.calls.append("complete_multipart_upload")
+        return {}
+
+    def abort_multipart_upload(self, **kwargs):
+        self.calls.append("abort_multipart_upload")
+        return {}
+
+
+@pytest.fixture
+def s3_storage():
+    storage = S3StorageBackend(
+        bucket="bucket", region="ap-northeast-2", max_concurrency=2, part_size=0
+    )
+    storage._client = FakeS3Client()
+    yield storage
+    storage.shutdown()
+
+
+@pytest.fixture
+def local_storage(tmp_path):
+    storage = LocalStorageBackend(
+        root_dir=str(tmp_path),
+        base_url="http://localhost:8000/static/images",
+        max_concurrency=2,
+        chunk_size=1024,
+    )
+    yield storage
+    storage.shutdown()
+
+
+def make_upload_file(size: int) -> UploadFile:
+    return UploadFile(file=io.BytesIO(b"x" * size), filename="image.png")
+
+
+async def test_s3_rejects_small_upload_over_limit(s3_storage):
+    with pytest.raises(InvalidImageUpload):
+        await s3_storage.upload(make_upload_file(2048), "uploads/a.png", None, 1024)
+
+    assert s3_storage.client.calls == []
+
+
+async def test_s3_aborts_multipart_upload_over_limit(s3_storage):
+    with pytest.raises(InvalidImageUpload):
+        await s3_storage.upload(
+            make_upload_file(PART_SIZE * 2 + 1), "uploads/a.png", None, PART_SIZE * 2
+        )
+
+    assert s3_storage.client.calls[0] == "create_multipart_upload"
+    assert s3_storage.client.calls[-1] == "abort_multipart_upload"
+    assert "complete_multipart_upload" not in s3_storage.client.calls
+
+
+async def test_local_removes_temp_file_over_limit(local_storage, tmp_path):
+    with pytest.raises(InvalidImageUpload):
+        await local_storage.upload(make_upload_file(4096), "uploads/a.png", None, 3000)
+
+    assert os.listdir(tmp_path / "uploads") == []
+
+
+async def test_local_upload_within_limit(local_storage, tmp_path):
+    await local_storage.upload(make_upload_file(3000), "uploads/a.png", None, 3000)
+
+    assert (tmp_path / "uploads" / "a.png").read_bytes() == b"x" * 3000